@@ -758,9 +758,7 @@ class ChatOrchestrator(BaseAgent):
         # Update categorization session with results
         if self.categorization_session:
             classifications = categorization_data.get("classifications", [])
-            for classification_dict in classifications:
-                fund_categorization = FundCategorization(**classification_dict)
-                self.categorization_session.add_fund_categorization(fund_categorization)
+            self.categorization_session.bulk_add(classifications)
         
         # Determine next action based on confidence levels
         needs_review = summary.get("requires_user_input", 0)
@@ -164,7 +164,7 @@ class ClassificationAgent(BaseAgent):
             
             for i, item_data in enumerate(portfolio_data):
                 portfolio_item = PortfolioItem(**item_data)
-                ticker = portfolio_item.ticker.upper()
+                ticker = portfolio_item.ticker_key
                 
                 yield await self.emit_status("classifying_fund", {
                     "ticker": ticker,
@@ -242,7 +242,7 @@ class ClassificationAgent(BaseAgent):
         
         Combines rule-based, pattern-based, and research-based classification.
         """
-        ticker = portfolio_item.ticker.upper()
+        ticker = portfolio_item.ticker_key
         fund_name = portfolio_item.name
         
         # Initialize result
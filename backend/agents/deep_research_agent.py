@@ -208,7 +208,7 @@ class DeepResearchAgent(BaseAgent):
         
         for item_data in portfolio_items:
             portfolio_item = PortfolioItem(**item_data)
-            ticker = portfolio_item.ticker.upper()
+            ticker = portfolio_item.ticker_key
             fund_name = portfolio_item.name
             
             # Basic fund information query
@@ -12,7 +12,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from agents.base_agent import BaseAgent, AgentType, AgentMessage, MessageType
-from models.unified_models import PortfolioItem, ProcessingSession, portfolio_item_from_csv_row
+from models.unified_models import PortfolioItem, ProcessingSession, portfolio_items_from_dataframe
 # Temporarily disable tracing imports
 
 
@@ -146,31 +146,11 @@ class PortfolioIntakeAgent(BaseAgent):
             if df is None:
                 raise ValueError("Unable to read CSV file with any supported encoding")
             
-            # Process each row
-            for _, row in df.iterrows():
-                try:
-                    # Convert pandas Series to dict
-                    row_dict = row.to_dict()
-                    
-                    # Clean up any NaN values
-                    clean_row = {}
-                    for key, value in row_dict.items():
-                        if pd.isna(value):
-                            clean_row[key] = None
-                        else:
-                            clean_row[key] = str(value) if not isinstance(value, str) else value
-                    
-                    # Create portfolio item
-                    portfolio_item = portfolio_item_from_csv_row(clean_row)
-                    
-                    # Validate required fields
-                    if portfolio_item.ticker and portfolio_item.name:
-                        portfolio_items.append(portfolio_item)
-                    
-                except Exception as e:
-                    # Log warning but continue processing other rows
-                    print(f"Warning: Failed to process row {row.name}: {e}")
-                    continue
+            # Convert all rows in one pass and keep those with required fields
+            portfolio_items = [
+                item for item in portfolio_items_from_dataframe(df)
+                if item.ticker and item.name
+            ]
             
         except Exception as e:
             raise ValueError(f"Failed to process CSV file: {str(e)}")
@@ -188,27 +168,11 @@ class PortfolioIntakeAgent(BaseAgent):
             # Read Excel file (try first sheet)
             df = pd.read_excel(file_path, sheet_name=0)
             
-            # Process each row similar to CSV
-            for _, row in df.iterrows():
-                try:
-                    row_dict = row.to_dict()
-                    
-                    # Clean up NaN values
-                    clean_row = {}
-                    for key, value in row_dict.items():
-                        if pd.isna(value):
-                            clean_row[key] = None
-                        else:
-                            clean_row[key] = str(value) if not isinstance(value, str) else value
-                    
-                    portfolio_item = portfolio_item_from_csv_row(clean_row)
-                    
-                    if portfolio_item.ticker and portfolio_item.name:
-                        portfolio_items.append(portfolio_item)
-                        
-                except Exception as e:
-                    print(f"Warning: Failed to process Excel row {row.name}: {e}")
-                    continue
+            # Process rows the same way as CSV
+            portfolio_items = [
+                item for item in portfolio_items_from_dataframe(df)
+                if item.ticker and item.name
+            ]
                     
         except Exception as e:
             raise ValueError(f"Failed to process Excel file: {str(e)}")
@@ -81,7 +81,7 @@ class ResearchAgent(BaseAgent):
             for item_data in portfolio_data:
                 try:
                     portfolio_item = PortfolioItem(**item_data)
-                    ticker = portfolio_item.ticker.upper()
+                    ticker = portfolio_item.ticker_key
                     
                     yield await self.emit_status("researching_fund", {
                         "ticker": ticker,
@@ -142,7 +142,7 @@ class ResearchAgent(BaseAgent):
     
     async def _find_fund_document(self, portfolio_item: PortfolioItem) -> Optional[DocumentSource]:
         """Find fund document for a specific portfolio item."""
-        ticker = portfolio_item.ticker.upper()
+        ticker = portfolio_item.ticker_key
         
         # Check if we already have the document locally
         local_source = await self._check_local_cache(ticker)
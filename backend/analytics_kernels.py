@@ -0,0 +1,52 @@
+"""Numeric kernels for fund analytics, JIT-compiled with numba when available."""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator; the kernels below are plain NumPy."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def summarize(equity, fixed, drift, ret_risk):
+    """Return mean/std of equity and fixed income, drift mean/max and return-per-risk median."""
+    return (
+        np.mean(equity),
+        np.std(equity),
+        np.mean(fixed),
+        np.std(fixed),
+        np.mean(drift),
+        np.max(np.abs(drift)),
+        np.median(ret_risk),
+    )
+
+
+def summarize_funds(arr) -> dict:
+    """Summarise a structured fund array (see test_mock_data.MOCK_DTYPE)."""
+    if len(arr) == 0:
+        return {}
+
+    (equity_mean, equity_std, fixed_mean, fixed_std,
+     drift_mean, drift_max, ret_risk_median) = summarize(
+        np.ascontiguousarray(arr["equity_pct"]),
+        np.ascontiguousarray(arr["fixed_income_pct"]),
+        np.ascontiguousarray(arr["drift"]),
+        np.ascontiguousarray(arr["return_per_risk"]),
+    )
+    return {
+        "equity_pct_mean": float(equity_mean),
+        "equity_pct_std": float(equity_std),
+        "fixed_income_pct_mean": float(fixed_mean),
+        "fixed_income_pct_std": float(fixed_std),
+        "drift_mean": float(drift_mean),
+        "drift_max": float(drift_max),
+        "return_per_risk_median": float(ret_risk_median),
+    }
@@ -401,7 +401,7 @@ async def get_chat_history(session_id: str):
     
     return {
         "session_id": session_id,
-        "chat_history": session.chat_history
+        "chat_history": session.chat_history.to_messages()
     }
 
 
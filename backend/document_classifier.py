@@ -7,7 +7,7 @@ import asyncio
 import json
 import os
 import re
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
@@ -42,6 +42,14 @@ except ImportError:
 
 from pydantic import BaseModel
 
+# Terminal states of a Gemini Batch API job
+BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
 
 class DocumentType(str, Enum):
     """Document type classifications."""
@@ -64,10 +72,11 @@ class ClassificationResult:
 class DocumentClassifier:
     """AI-powered document classifier using Gemini and Docling."""
     
-    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash"):
+    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash",
+                 client: Optional[Any] = None):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.model_name = model_name
-        self.client = None
+        self.client = client  # shared genai.Client, or None to create one on first use
         self.docling_converter = None
         self._initialized = False
     
@@ -82,10 +91,10 @@ class DocumentClassifier:
         if not DOCLING_AVAILABLE:
             raise ImportError("Docling not available. Install with: pip install docling")
         
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
-        
-        self.client = genai.Client(api_key=self.api_key)
+        if self.client is None:
+            if not self.api_key:
+                raise ValueError("GEMINI_API_KEY not found in environment variables")
+            self.client = genai.Client(api_key=self.api_key)
         self.docling_converter = DocumentConverter()
         self._initialized = True
     
@@ -185,6 +194,39 @@ JSON:"""
 
         return prompt
     
+    def _generation_config(self) -> "GenerateContentConfig":
+        """Generation settings for classification calls."""
+        return GenerateContentConfig(
+            temperature=0.1,  # Low temperature for consistent classification
+            max_output_tokens=1024,
+            top_p=0.95,
+        )
+    
+    def _parse_classification_response(self, response_text: str, classification_time: float) -> ClassificationResult:
+        """Parse Gemini's JSON classification response into a result."""
+        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        if json_match:
+            json_str = json_match.group()
+            result_dict = json.loads(json_str)
+        else:
+            result_dict = json.loads(response_text)
+        
+        # Validate and create result
+        document_type = DocumentType(result_dict.get("document_type", "unknown"))
+        confidence = max(0.0, min(1.0, float(result_dict.get("confidence", 0.5))))
+        reasoning = str(result_dict.get("reasoning", "AI classification completed"))
+        fund_count = result_dict.get("fund_count_estimate")
+        fund_names = result_dict.get("fund_names")
+        
+        return ClassificationResult(
+            document_type=document_type,
+            confidence=confidence,
+            reasoning=reasoning,
+            fund_count_estimate=fund_count,
+            fund_names=fund_names,
+            classification_time=classification_time
+        )
+    
     async def classify_document(self, pdf_path: str) -> ClassificationResult:
         """Classify document using AI analysis of content."""
         import time
@@ -203,48 +245,15 @@ JSON:"""
             # Create classification prompt
             prompt = self._create_classification_prompt(markdown_content, filename_hints)
             
-            # Configure generation settings
-            config = GenerateContentConfig(
-                temperature=0.1,  # Low temperature for consistent classification
-                max_output_tokens=1024,
-                top_p=0.95,
-            )
-            
             # Call Gemini for classification
             response = await asyncio.to_thread(
                 self.client.models.generate_content,
                 model=self.model_name,
                 contents=prompt,
-                config=config
+                config=self._generation_config()
             )
             
-            response_text = response.text.strip()
-            
-            # Parse JSON response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                result_dict = json.loads(json_str)
-            else:
-                result_dict = json.loads(response_text)
-            
-            # Validate and create result
-            document_type = DocumentType(result_dict.get("document_type", "unknown"))
-            confidence = max(0.0, min(1.0, float(result_dict.get("confidence", 0.5))))
-            reasoning = str(result_dict.get("reasoning", "AI classification completed"))
-            fund_count = result_dict.get("fund_count_estimate")
-            fund_names = result_dict.get("fund_names")
-            
-            classification_time = time.time() - start_time
-            
-            return ClassificationResult(
-                document_type=document_type,
-                confidence=confidence,
-                reasoning=reasoning,
-                fund_count_estimate=fund_count,
-                fund_names=fund_names,
-                classification_time=classification_time
-            )
+            return self._parse_classification_response(response.text.strip(), time.time() - start_time)
             
         except json.JSONDecodeError as e:
             # Fallback to filename-based classification
@@ -278,6 +287,70 @@ JSON:"""
             classification_time=classification_time
         )
     
+    async def classify_documents_batch(self, pdf_paths: List[str], poll_interval: float = 30.0) -> List[ClassificationResult]:
+        """Classify documents with a single Gemini Batch API job.
+        
+        Batch jobs cost half as much as interactive calls but may take minutes or
+        hours to finish, so this is meant for offline runs. Documents that can't be
+        parsed or whose response can't be read fall back to filename-based
+        classification; a job that doesn't succeed raises RuntimeError.
+        """
+        import time
+        start_time = time.time()
+        
+        self._initialize()
+        
+        # Build one inline request per document that Docling can parse
+        results: List[Optional[ClassificationResult]] = [None] * len(pdf_paths)
+        requests = []
+        request_indices = []
+        for i, pdf_path in enumerate(pdf_paths):
+            try:
+                docling_result = self.docling_converter.convert(pdf_path)
+                markdown_content = docling_result.document.export_to_markdown()
+            except Exception as e:
+                results[i] = self._fallback_classification(pdf_path, f"Classification error: {str(e)}", time.time() - start_time)
+                continue
+            
+            prompt = self._create_classification_prompt(markdown_content, self._get_filename_hints(pdf_path))
+            requests.append({"contents": prompt, "config": self._generation_config()})
+            request_indices.append(i)
+        
+        if requests:
+            job = await asyncio.to_thread(
+                self.client.batches.create,
+                model=self.model_name,
+                src=requests,
+                config={"display_name": "fund-document-classification"}
+            )
+            
+            while job.state.name not in BATCH_DONE_STATES:
+                await asyncio.sleep(poll_interval)
+                job = await asyncio.to_thread(self.client.batches.get, name=job.name)
+            
+            if job.state.name != "JOB_STATE_SUCCEEDED":
+                raise RuntimeError(f"Batch classification job {job.name} ended in {job.state.name}")
+            
+            # Inline responses come back in request order
+            classification_time = time.time() - start_time
+            for i, inline_response in zip(request_indices, job.dest.inlined_responses):
+                try:
+                    if inline_response.error:
+                        raise RuntimeError(str(inline_response.error))
+                    results[i] = self._parse_classification_response(
+                        inline_response.response.text.strip(), classification_time
+                    )
+                except Exception as e:
+                    results[i] = self._fallback_classification(
+                        pdf_paths[i], f"Batch classification error: {str(e)}", classification_time
+                    )
+        
+        return [
+            result if result is not None
+            else self._fallback_classification(pdf_path, "No batch response", time.time() - start_time)
+            for pdf_path, result in zip(pdf_paths, results)
+        ]
+    
     async def classify_multiple_documents(self, pdf_paths: List[str]) -> List[ClassificationResult]:
         """Classify multiple documents in parallel."""
         tasks = [self.classify_document(path) for path in pdf_paths]
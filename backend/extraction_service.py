@@ -331,7 +331,7 @@ Return only the fund name, ticker, and basic info you can find.
 class FundExtractionService:
     """Enhanced fund extraction service with AI-powered document classification."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[Any] = None):
         # Initialize legacy extractors (kept for backward compatibility)
         self.extractors = {
             'llamaparse': LlamaParseExtractor(),
@@ -343,23 +343,23 @@ class FundExtractionService:
         self.gemini_service = None
         self.multi_fund_extractor = None
         
-        # Try to initialize new AI components
-        self._initialize_ai_services()
+        # Try to initialize new AI components, sharing one Gemini client if given
+        self._initialize_ai_services(client)
         
         self.default_method = 'auto'  # Changed from 'llamaparse' to 'auto'
     
-    def _initialize_ai_services(self):
+    def _initialize_ai_services(self, client: Optional[Any] = None):
         """Initialize AI-powered extraction services."""
         try:
             # Initialize document classifier
-            self.document_classifier = DocumentClassifier()
+            self.document_classifier = DocumentClassifier(client=client)
             
             # Initialize single-fund Gemini service
             from gemini_extraction_service import GeminiExtractionService
-            self.gemini_service = GeminiExtractionService()
+            self.gemini_service = GeminiExtractionService(client=client)
             
             # Initialize multi-fund extractor
-            self.multi_fund_extractor = GeminiMultiFundExtractor()
+            self.multi_fund_extractor = GeminiMultiFundExtractor(client=client)
             
             print("✓ AI-powered extraction services initialized")
             
@@ -136,10 +136,11 @@ class DoclingParser:
 class GeminiExtractor:
     """Fund data extractor using Google Gemini models."""
     
-    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash"):
+    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash",
+                 client: Optional[Any] = None):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.model_name = model_name
-        self.client = None
+        self.client = client  # shared genai.Client, or None to create one on first use
         self._initialized = False
     
     def _initialize(self):
@@ -150,10 +151,10 @@ class GeminiExtractor:
         if not GEMINI_AVAILABLE:
             raise ImportError("Google GenAI not available. Install with: pip install google-genai")
         
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
-        
-        self.client = genai.Client(api_key=self.api_key)
+        if self.client is None:
+            if not self.api_key:
+                raise ValueError("GEMINI_API_KEY not found in environment variables")
+            self.client = genai.Client(api_key=self.api_key)
         self._initialized = True
     
     def _create_extraction_prompt(self, markdown_content: str, tables_markdown: List[str], pdf_filename: str) -> str:
@@ -292,9 +293,10 @@ JSON:"""
 class GeminiExtractionService:
     """Main service combining Docling parsing with Gemini extraction."""
     
-    def __init__(self, gemini_api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash"):
+    def __init__(self, gemini_api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash",
+                 client: Optional[Any] = None):
         self.parser = DoclingParser()
-        self.extractor = GeminiExtractor(gemini_api_key, model_name)
+        self.extractor = GeminiExtractor(gemini_api_key, model_name, client)
     
     def _calculate_confidence_score(self, fund_data: FundData, parsing_result: DocumentParsingResult) -> float:
         """Calculate confidence score based on fund type and extracted data completeness."""
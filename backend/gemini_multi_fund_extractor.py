@@ -42,6 +42,12 @@ except ImportError:
     DOCLING_AVAILABLE = False
     DocumentConverter = None
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from pydantic import BaseModel
 
 import sys
@@ -49,6 +55,62 @@ sys.path.append('..')
 from src.models import FundData, FundComparisonData
 
 
+# Outermost JSON object in a model response
+_JSON_RE = re.compile(rb'\{.*\}', re.DOTALL)
+
+
+def _parse_json_response(response_text: str) -> Dict[str, Any]:
+    """Parse the JSON object embedded in a Gemini response."""
+    response_bytes = response_text.encode()
+    json_match = _JSON_RE.search(response_bytes)
+    if json_match:
+        start, end = json_match.span()
+        return _json_loads(response_bytes[start:end])
+    return _json_loads(response_bytes)
+
+
+# Keywords that mark the paragraphs FundData fields are usually extracted from
+_RELEVANT_SECTION_RE = re.compile(
+    r'\b(NAV|Expense|Net Assets|Return|Turnover|Holdings|Inception|Objective|Benchmark)\b',
+    re.IGNORECASE
+)
+
+
+def _condense(content: str, budget: int = 6000) -> str:
+    """Reduce section content to its most relevant paragraphs within a character budget.
+
+    Paragraphs are scored by the number of financial keyword matches; the
+    highest-scoring ones are kept, in their original order, until the budget
+    is reached. The first paragraph that doesn't fit is truncated to the
+    remaining budget rather than dropped, so a single oversized paragraph
+    (e.g. a Docling table with no blank lines) still yields content. Content
+    already within budget is returned unchanged.
+    """
+    if len(content) <= budget:
+        return content
+    
+    paragraphs = content.split('\n\n')
+    ranked = sorted(
+        range(len(paragraphs)),
+        key=lambda i: len(_RELEVANT_SECTION_RE.findall(paragraphs[i])),
+        reverse=True
+    )
+    
+    kept = {}
+    used = 0
+    for i in ranked:
+        size = len(paragraphs[i]) + 2
+        if used + size > budget:
+            remaining = budget - used - (2 if kept else 0)
+            if remaining > 0:
+                kept[i] = paragraphs[i][:remaining]
+            break
+        kept[i] = paragraphs[i]
+        used += size
+    
+    return '\n\n'.join(kept[i] for i in sorted(kept))
+
+
 @dataclass
 class FundSection:
     """Represents a section of the document containing one fund."""
@@ -77,10 +139,11 @@ class MultiFundExtractionResult:
 class GeminiSplitter:
     """Splits multi-fund documents using Gemini AI."""
     
-    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash"):
+    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash",
+                 client: Optional[Any] = None):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.model_name = model_name
-        self.client = None
+        self.client = client  # shared genai.Client, or None to create one on first use
         self._initialized = False
     
     def _initialize(self):
@@ -91,10 +154,10 @@ class GeminiSplitter:
         if not GEMINI_AVAILABLE:
             raise ImportError("Google GenAI not available. Install with: pip install google-genai")
         
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
-        
-        self.client = genai.Client(api_key=self.api_key)
+        if self.client is None:
+            if not self.api_key:
+                raise ValueError("GEMINI_API_KEY not found in environment variables")
+            self.client = genai.Client(api_key=self.api_key)
         self._initialized = True
     
     def _create_splitting_prompt(self, markdown_content: str, document_filename: str) -> str:
@@ -166,15 +229,8 @@ JSON:"""
                 config=config
             )
             
-            response_text = response.text.strip()
-            
             # Parse JSON response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                result_dict = json.loads(json_str)
-            else:
-                result_dict = json.loads(response_text)
+            result_dict = _parse_json_response(response.text)
             
             return result_dict.get("funds_found", [])
             
@@ -244,12 +300,13 @@ JSON:"""
 class GeminiMultiFundExtractor:
     """Multi-fund extractor using Docling + Gemini."""
     
-    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash"):
+    def __init__(self, api_key: Optional[str] = None, model_name: str = "gemini-2.5-flash",
+                 client: Optional[Any] = None):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.model_name = model_name
-        self.client = None
+        self.client = client  # shared genai.Client, or None to create one on first use
         self.docling_converter = None
-        self.splitter = GeminiSplitter(api_key, model_name)
+        self.splitter = GeminiSplitter(api_key, model_name, client)
         self._initialized = False
     
     def _initialize(self):
@@ -263,28 +320,25 @@ class GeminiMultiFundExtractor:
         if not DOCLING_AVAILABLE:
             raise ImportError("Docling not available. Install with: pip install docling")
         
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
-        
-        self.client = genai.Client(api_key=self.api_key)
+        if self.client is None:
+            if not self.api_key:
+                raise ValueError("GEMINI_API_KEY not found in environment variables")
+            self.client = genai.Client(api_key=self.api_key)
         self.docling_converter = DocumentConverter()
         self._initialized = True
     
-    def _create_fund_extraction_prompt(self, section_content: str, fund_identifier: str, section_title: str) -> str:
-        """Create extraction prompt for a single fund section."""
-        
-        prompt = f"""
-You are a financial data extractor. Extract fund information from this section of a multi-fund document.
-
-FUND SECTION: {section_title}
-FUND IDENTIFIER: {fund_identifier}
-
-SECTION CONTENT:
-{section_content}
+    # Static parts of the fund extraction prompt, rendered once at class
+    # definition so each call only joins the per-section pieces.
+    _PROMPT_HEAD = (
+        "\nYou are a financial data extractor. Extract fund information from this section of a multi-fund document.\n"
+        "\nFUND SECTION: "
+    )
+    _PROMPT_TAIL_TEMPLATE = "\nFUND IDENTIFIER: {id}\n\nSECTION CONTENT:\n"
+    _PROMPT_RULES = """
 
 Extract the following information and return ONLY a valid JSON object:
 
-{{
+{
     "fund_name": "Full fund name as it appears",
     "ticker": "Ticker symbol if available or null",
     "fund_type": "Type of fund (ETF, Mutual Fund, Index Fund, etc.) or null",
@@ -316,7 +370,7 @@ Extract the following information and return ONLY a valid JSON object:
     "management_company": "Management company or fund family or null",
     "benchmark": "Primary benchmark index or null",
     "investment_objective": "Fund's investment objective or strategy description or null"
-}}
+}
 
 EXTRACTION RULES:
 1. Extract numeric values as numbers, not strings
@@ -328,15 +382,18 @@ EXTRACTION RULES:
 7. Return ONLY the JSON object, no additional text
 
 JSON:"""
-        
-        return prompt
+    
+    def _create_fund_extraction_prompt(self, section_content: str, fund_identifier: str, section_title: str) -> str:
+        """Create extraction prompt for a single fund section."""
+        tail = self._PROMPT_TAIL_TEMPLATE.format(id=fund_identifier)
+        return "".join((self._PROMPT_HEAD, section_title, tail, section_content, self._PROMPT_RULES))
     
     async def extract_fund_from_section(self, section: FundSection) -> Optional[FundData]:
         """Extract fund data from a single section using Gemini."""
         self._initialize()
         
         prompt = self._create_fund_extraction_prompt(
-            section.content, 
+            _condense(section.content), 
             section.fund_identifier, 
             section.section_title
         )
@@ -355,15 +412,8 @@ JSON:"""
                 config=config
             )
             
-            response_text = response.text.strip()
-            
             # Parse JSON response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                fund_dict = json.loads(json_str)
-            else:
-                fund_dict = json.loads(response_text)
+            fund_dict = _parse_json_response(response.text)
             
             # Create FundData object
             fund_data = FundData(**fund_dict)
@@ -1,18 +1,96 @@
 """Unified data models for portfolio and fund data."""
 
-from typing import Dict, List, Optional, Union, Literal, Any
-from pydantic import BaseModel, Field
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union, Literal, Any
+from collections import Counter
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, computed_field
+from datetime import datetime, timezone
+from enum import Enum
+import time
+import pandas as pd
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
 
 # Import our existing fund data model
 import sys
-sys.path.append('..')
+if '..' not in sys.path:
+    sys.path.append('..')
 from src.models import FundData as OriginalFundData
 
 
+class AssetClass(str, Enum):
+    """Primary asset classes for fund categorization."""
+    EQUITY = "Equity"
+    FIXED_INCOME = "Fixed Income"
+    CASH = "Cash"
+    ALTERNATIVES = "Alternatives"
+
+
+class FileType(str, Enum):
+    """Supported input file types."""
+    CSV = "csv"
+    EXCEL = "excel"
+    PDF = "pdf"
+    JSON = "json"
+
+
+class WorkflowStage(str, Enum):
+    """Stages of the categorization workflow."""
+    UPLOADED = "uploaded"
+    RESEARCHING = "researching"
+    CLASSIFYING = "classifying"
+    REVIEWING = "reviewing"
+    COMPLETE = "complete"
+
+
+class QuestionType(str, Enum):
+    """Categorization fields a user question can ask about."""
+    ASSET_CLASS = "asset_class"
+    EQUITY_REGION = "equity_region"
+    EQUITY_STYLE = "equity_style"
+    EQUITY_SIZE = "equity_size"
+    FIXED_INCOME_TYPE = "fixed_income_type"
+    FIXED_INCOME_DURATION = "fixed_income_duration"
+
+
+class DataSource(str, Enum):
+    """Where extracted fund data came from."""
+    PDF = "pdf"
+    WEB = "web"
+    API = "api"
+    MANUAL = "manual"
+
+
+# Second-resolution prefix of the last chat timestamp, reused within the same second
+_last_iso_sec: int = 0
+_last_iso_str: str = ""
+
+
+def _utc_iso_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with microseconds."""
+    global _last_iso_sec, _last_iso_str
+    ns = time.time_ns()
+    sec = ns // 1_000_000_000
+    if sec != _last_iso_sec:
+        _last_iso_str = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _last_iso_sec = sec
+    return f"{_last_iso_str}.{(ns % 1_000_000_000) // 1000:06d}"
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """Convert nanoseconds since the epoch to a naive UTC datetime."""
+    return datetime.fromtimestamp(ns / 1e9, timezone.utc).replace(tzinfo=None)
+
+
 class PortfolioItem(BaseModel):
     """Individual item in a portfolio (from CSV)."""
     
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+    
     # Basic identifiers
     ticker: str = Field(..., description="Fund ticker symbol, e.g. 'VTI'")
     name: str = Field(..., description="Fund name, e.g. 'Vanguard Total Stock Market ETF'")
@@ -34,14 +112,21 @@ class PortfolioItem(BaseModel):
     requires_prospectus: bool = Field(True, description="Whether to fetch prospectus")
     prospectus_url: Optional[str] = Field(None, description="URL to fund prospectus")
     prospectus_local_path: Optional[str] = Field(None, description="Local path to prospectus PDF")
+    
+    @property
+    def ticker_key(self) -> str:
+        """Upper-cased ticker used as the lookup key in session dicts."""
+        return self.ticker.upper()
 
 
 class ExtendedFundData(OriginalFundData):
     """Extended fund data that includes our extraction plus additional metadata."""
     
+    model_config = ConfigDict(use_enum_values=True)
+    
     # Source information
     ticker: Optional[str] = Field(None, description="Fund ticker symbol")
-    data_source: Literal["pdf", "web", "api", "manual"] = Field("pdf", description="Data source")
+    data_source: DataSource = Field(DataSource.PDF.value, description="Data source")
     extraction_method: str = Field("llamaparse", description="Extraction method used")
     source_document: Optional[str] = Field(None, description="Path to source document")
     
@@ -55,13 +140,26 @@ class ExtendedFundData(OriginalFundData):
     processing_time: Optional[float] = Field(None, description="Processing time in seconds")
     
     # Related data
-    portfolio_allocations: Dict[str, float] = Field(default_factory=dict, description="Portfolio allocations by risk profile")
-    sector_breakdown: Dict[str, float] = Field(default_factory=dict, description="Sector allocation breakdown")
+    # Rarely populated; left as None until first written (see ensure_* helpers)
+    portfolio_allocations: Optional[Dict[str, float]] = Field(None, description="Portfolio allocations by risk profile")
+    sector_breakdown: Optional[Dict[str, float]] = Field(None, description="Sector allocation breakdown")
     
     # Analysis fields
     benchmark_comparison: Optional[Dict[str, float]] = Field(None, description="Comparison with benchmark")
     risk_metrics: Optional[Dict[str, float]] = Field(None, description="Risk analysis metrics")
     
+    def ensure_portfolio_allocations(self) -> Dict[str, float]:
+        """Get portfolio allocations, creating the dict on first use."""
+        if self.portfolio_allocations is None:
+            self.portfolio_allocations = {}
+        return self.portfolio_allocations
+    
+    def ensure_sector_breakdown(self) -> Dict[str, float]:
+        """Get the sector breakdown, creating the dict on first use."""
+        if self.sector_breakdown is None:
+            self.sector_breakdown = {}
+        return self.sector_breakdown
+    
     
 class PortfolioAnalysis(BaseModel):
     """Analysis results for a portfolio."""
@@ -88,15 +186,47 @@ class PortfolioAnalysis(BaseModel):
     drift_analysis: Dict[str, float] = Field(default_factory=dict, description="Allocation drift by fund")
 
 
+class ChatHistory(BaseModel):
+    """Chat messages stored column-wise, one list per message attribute."""
+    
+    roles: List[str] = Field(default_factory=list, description="Message roles")
+    contents: List[str] = Field(default_factory=list, description="Message contents")
+    timestamps: List[str] = Field(default_factory=list, description="Message timestamps (ISO 8601)")
+    metadata: Dict[int, Dict[str, Any]] = Field(default_factory=dict, description="Message metadata by message index")
+    
+    def __len__(self) -> int:
+        return len(self.roles)
+    
+    def append(self, role: str, content: str, timestamp: str, metadata: Dict[str, Any] = None):
+        """Append a message."""
+        if metadata:
+            self.metadata[len(self.roles)] = metadata
+        self.roles.append(role)
+        self.contents.append(content)
+        self.timestamps.append(timestamp)
+    
+    def to_messages(self) -> List[Dict[str, Any]]:
+        """Materialize the history as a list of message dicts."""
+        messages = []
+        for i, (role, content, timestamp) in enumerate(zip(self.roles, self.contents, self.timestamps)):
+            message = {"role": role, "content": content, "timestamp": timestamp}
+            if i in self.metadata:
+                message["metadata"] = self.metadata[i]
+            messages.append(message)
+        return messages
+
+
 class ProcessingSession(BaseModel):
     """Session data for processing workflow."""
     
+    model_config = ConfigDict(use_enum_values=True)
+    
     session_id: str = Field(..., description="Unique session identifier")
     user_id: Optional[str] = Field(None, description="User identifier")
     
     # Input data
     input_file_path: Optional[str] = Field(None, description="Path to uploaded file")
-    file_type: Literal["csv", "excel", "pdf", "json"] = Field(..., description="Input file type")
+    file_type: FileType = Field(..., description="Input file type")
     
     # Processed data
     portfolio_items: List[PortfolioItem] = Field(default_factory=list, description="Parsed portfolio items")
@@ -111,31 +241,41 @@ class ProcessingSession(BaseModel):
     status: str = Field("idle", description="Processing status")
     
     # Chat context
-    chat_history: List[Dict[str, str]] = Field(default_factory=list, description="Chat conversation history")
+    chat_history: ChatHistory = Field(default_factory=ChatHistory, description="Chat conversation history")
     user_preferences: Dict[str, Any] = Field(default_factory=dict, description="User preferences and selections")
     
-    # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Session creation time")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update time")
+    # Timestamps (nanoseconds since the epoch; datetime views below)
+    created_at_ns: int = Field(default_factory=time.time_ns, description="Session creation time (ns since epoch)")
+    updated_at_ns: int = Field(default_factory=time.time_ns, description="Last update time (ns since epoch)")
+    
+    @computed_field
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a naive UTC datetime."""
+        return _ns_to_datetime(self.created_at_ns)
+    
+    @computed_field
+    @property
+    def updated_at(self) -> datetime:
+        """Last update time as a naive UTC datetime."""
+        return _ns_to_datetime(self.updated_at_ns)
     
     def update_progress(self, stage: str, progress: float, status: str = "processing"):
         """Update processing progress."""
         self.stage = stage
         self.progress = max(0.0, min(1.0, progress))
         self.status = status
-        self.updated_at = datetime.utcnow()
-    
-    def add_chat_message(self, role: str, content: str, metadata: Dict[str, Any] = None):
-        """Add a message to chat history."""
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        if metadata:
-            message["metadata"] = metadata
-        self.chat_history.append(message)
-        self.updated_at = datetime.utcnow()
+        self.updated_at_ns = time.time_ns()
+    
+    def add_chat_message(self, role: str, content: str, metadata: Dict[str, Any] = None, defer_timestamp: bool = False):
+        """Add a message to chat history.
+        
+        Pass ``defer_timestamp=True`` when adding messages in a batch to leave
+        ``updated_at`` for the caller to set once afterwards.
+        """
+        self.chat_history.append(role, content, _utc_iso_timestamp(), metadata)
+        if not defer_timestamp:
+            self.updated_at_ns = time.time_ns()
     
     def get_fund_by_ticker(self, ticker: str) -> Optional[ExtendedFundData]:
         """Get fund data by ticker."""
@@ -144,12 +284,80 @@ class ProcessingSession(BaseModel):
     def add_fund_data(self, ticker: str, fund_data: ExtendedFundData):
         """Add extracted fund data."""
         self.fund_extractions[ticker.upper()] = fund_data
-        self.updated_at = datetime.utcnow()
+        self.updated_at_ns = time.time_ns()
+    
+    def to_msgpack(self) -> bytes:
+        """Serialize the session to msgpack for fast reloading."""
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec not available. Install with: pip install msgspec")
+        return _MSGPACK_ENCODER.encode(self.model_dump())
+    
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "ProcessingSession":
+        """Load a session written by to_msgpack.
+        
+        The data was validated when the session was built, so models are
+        reconstructed with ``model_construct`` and no validation runs.
+        """
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec not available. Install with: pip install msgspec")
+        
+        asdict = msgspec.structs.asdict
+        struct = _SESSION_DECODER.decode(data)
+        fields = asdict(struct)
+        fields["chat_history"] = ChatHistory.model_construct(**asdict(struct.chat_history))
+        fields["portfolio_items"] = [
+            PortfolioItem.model_construct(**asdict(item)) for item in struct.portfolio_items
+        ]
+        fields["fund_extractions"] = {
+            ticker: ExtendedFundData.model_construct(**asdict(fund))
+            for ticker, fund in struct.fund_extractions.items()
+        }
+        if struct.portfolio_analysis is not None:
+            fields["portfolio_analysis"] = PortfolioAnalysis.model_construct(**asdict(struct.portfolio_analysis))
+        return cls.model_construct(**fields)
+
+
+def _mirror_struct(model: type, nested: Dict[str, Any] = None) -> type:
+    """Build a msgspec Struct with the same field names as a pydantic model.
+    
+    Only datetime fields and nested models are typed (naive datetimes are
+    stored as strings and need the type to decode back); everything else
+    decodes as plain Python values.
+    """
+    nested = nested or {}
+    fields = []
+    for name, field_info in model.model_fields.items():
+        if name in nested:
+            field_type = nested[name]
+        elif field_info.annotation in (datetime, Optional[datetime]):
+            field_type = field_info.annotation
+        else:
+            field_type = Any
+        fields.append((name, field_type))
+    return msgspec.defstruct(f"{model.__name__}MS", fields)
+
+
+if MSGSPEC_AVAILABLE:
+    PortfolioItemMS = _mirror_struct(PortfolioItem)
+    ExtendedFundDataMS = _mirror_struct(ExtendedFundData)
+    PortfolioAnalysisMS = _mirror_struct(PortfolioAnalysis)
+    ChatHistoryMS = _mirror_struct(ChatHistory)
+    ProcessingSessionMS = _mirror_struct(ProcessingSession, {
+        "chat_history": ChatHistoryMS,
+        "portfolio_items": List[PortfolioItemMS],
+        "fund_extractions": Dict[str, ExtendedFundDataMS],
+        "portfolio_analysis": Optional[PortfolioAnalysisMS],
+    })
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _SESSION_DECODER = msgspec.msgpack.Decoder(ProcessingSessionMS)
 
 
 class DocumentSource(BaseModel):
     """Information about a source document."""
     
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     url: Optional[str] = Field(None, description="Source URL")
     local_path: Optional[str] = Field(None, description="Local file path")
     document_type: str = Field(..., description="Type of document (prospectus, annual_report, etc.)")
@@ -192,12 +400,14 @@ class ExtractionResult(BaseModel):
 class FundCategorization(BaseModel):
     """Categorization result for a fund."""
     
+    model_config = ConfigDict(use_enum_values=True)
+    
     # Basic identifiers
     ticker: str = Field(..., description="Fund ticker symbol")
     fund_name: str = Field(..., description="Fund name")
     
     # Primary classification
-    asset_class: Literal["Equity", "Fixed Income", "Cash", "Alternatives"] = Field(..., description="Primary asset class")
+    asset_class: AssetClass = Field(..., description="Primary asset class")
     asset_class_confidence: float = Field(..., description="Confidence in asset class (0.0-1.0)")
     
     # Equity sub-classifications
@@ -211,7 +421,7 @@ class FundCategorization(BaseModel):
     
     # Research and classification metadata
     research_sources: List[str] = Field(default_factory=list, description="Sources used for classification")
-    key_holdings: List[Dict[str, Any]] = Field(default_factory=list, description="Key fund holdings")
+    key_holdings: Optional[List[Dict[str, Any]]] = Field(None, description="Key fund holdings (None until populated)")
     expense_ratio: Optional[float] = Field(None, description="Fund expense ratio")
     morningstar_category: Optional[str] = Field(None, description="Morningstar category if available")
     
@@ -230,6 +440,17 @@ class FundCategorization(BaseModel):
     data_completeness: float = Field(0.0, description="Completeness of available data (0.0-1.0)")
     classification_timestamp: datetime = Field(default_factory=datetime.utcnow, description="When classification was made")
     
+    @property
+    def ticker_key(self) -> str:
+        """Upper-cased ticker used as the lookup key in session dicts."""
+        return self.ticker.upper()
+    
+    def ensure_key_holdings(self) -> List[Dict[str, Any]]:
+        """Get key holdings, creating the list on first use."""
+        if self.key_holdings is None:
+            self.key_holdings = []
+        return self.key_holdings
+    
     def apply_override(self, new_asset_class: str, reason: str, override_by: str, **sub_categories):
         """Apply manual override to classification."""
         self.manual_override = True
@@ -245,13 +466,18 @@ class FundCategorization(BaseModel):
             if hasattr(self, key):
                 setattr(self, key, value)
         
-        # Lower confidence since it's manual
-        self.asset_class_confidence = max(0.95, self.asset_class_confidence)
+        # Manual overrides are treated as ground truth
+        self.asset_class_confidence = 1.0
+
+
+_FC_LIST_ADAPTER = TypeAdapter(List[FundCategorization])
 
 
 class CategorizationSession(BaseModel):
     """Session data for fund categorization workflow."""
     
+    model_config = ConfigDict(use_enum_values=True)
+    
     session_id: str = Field(..., description="Session identifier")
     portfolio_items: List[PortfolioItem] = Field(default_factory=list, description="Original portfolio items")
     
@@ -259,7 +485,7 @@ class CategorizationSession(BaseModel):
     fund_categorizations: Dict[str, FundCategorization] = Field(default_factory=dict, description="Categorizations by ticker")
     
     # Workflow state
-    current_stage: Literal["uploaded", "researching", "classifying", "reviewing", "complete"] = Field("uploaded", description="Current workflow stage")
+    current_stage: WorkflowStage = Field(WorkflowStage.UPLOADED.value, description="Current workflow stage")
     funds_needing_input: List[str] = Field(default_factory=list, description="Tickers requiring user input")
     current_fund_index: int = Field(0, description="Index of fund currently being reviewed")
     
@@ -268,8 +494,8 @@ class CategorizationSession(BaseModel):
     user_responses: List[Dict[str, Any]] = Field(default_factory=list, description="User responses to questions")
     
     # Session metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Session creation time")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update time")
+    created_at_ns: int = Field(default_factory=time.time_ns, description="Session creation time (ns since epoch)")
+    updated_at_ns: int = Field(default_factory=time.time_ns, description="Last update time (ns since epoch)")
     completed_at: Optional[datetime] = Field(None, description="Completion time")
     
     # Progress tracking
@@ -277,6 +503,49 @@ class CategorizationSession(BaseModel):
     categorized_funds: int = Field(0, description="Number of funds categorized")
     high_confidence_funds: int = Field(0, description="Number of high-confidence categorizations")
     
+    @computed_field
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a naive UTC datetime."""
+        return _ns_to_datetime(self.created_at_ns)
+    
+    @computed_field
+    @property
+    def updated_at(self) -> datetime:
+        """Last update time as a naive UTC datetime."""
+        return _ns_to_datetime(self.updated_at_ns)
+    
+    # Running high-confidence count for add/remove, with the confidence counted per key;
+    # kept in sync by add_fund_categorization, bulk_add and remove_fund_categorization
+    _tallied: Dict[str, float] = PrivateAttr(default_factory=dict)
+    _high_confidence_count: int = PrivateAttr(0)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Seed the running count from any initial categorizations."""
+        for key, categorization in self.fund_categorizations.items():
+            self._tally(key, categorization)
+    
+    def __copy__(self):
+        """Shallow copy with its own categorizations dict and running-count bookkeeping."""
+        copied = super().__copy__()
+        copied.__dict__["fund_categorizations"] = dict(self.fund_categorizations)
+        copied._tallied = dict(self._tallied)
+        return copied
+    
+    def _untally(self, key: str):
+        """Remove a key's contribution to the running count."""
+        # Snapshot the values counted, since categorizations are mutated in place by overrides
+        previous = self._tallied.pop(key, None)
+        if previous is not None:
+            self._high_confidence_count -= previous >= 0.8
+    
+    def _tally(self, key: str, categorization: FundCategorization):
+        """Record a categorization's contribution to the running count."""
+        self._untally(key)
+        confidence = categorization.asset_class_confidence
+        self._tallied[key] = confidence
+        self._high_confidence_count += confidence >= 0.8
+    
     def get_progress_percentage(self) -> float:
         """Get categorization progress as percentage."""
         if self.total_funds == 0:
@@ -289,10 +558,43 @@ class CategorizationSession(BaseModel):
     
     def add_fund_categorization(self, categorization: FundCategorization):
         """Add or update fund categorization."""
-        self.fund_categorizations[categorization.ticker.upper()] = categorization
+        key = categorization.ticker_key
+        self.fund_categorizations[key] = categorization
+        self._tally(key, categorization)
+        self.categorized_funds = len(self.fund_categorizations)
+        self.high_confidence_funds = self._high_confidence_count
+        self.updated_at_ns = time.time_ns()
+    
+    def remove_fund_categorization(self, ticker: str) -> Optional[FundCategorization]:
+        """Remove and return a fund's categorization, if present."""
+        key = ticker.upper()
+        categorization = self.fund_categorizations.pop(key, None)
+        if categorization is not None:
+            self._untally(key)
+            self.categorized_funds = len(self.fund_categorizations)
+            self.high_confidence_funds = self._high_confidence_count
+            self.updated_at_ns = time.time_ns()
+        return categorization
+    
+    def bulk_add(self, rows: List[Union[Dict[str, Any], FundCategorization]]):
+        """Add or update many fund categorizations at once.
+        
+        Dict rows are validated in a single list-adapter call, and the
+        progress counters and timestamp are updated once for the batch.
+        """
+        if all(isinstance(row, FundCategorization) for row in rows):
+            categorizations = rows
+        else:
+            categorizations = _FC_LIST_ADAPTER.validate_python(rows)
+        
+        for categorization in categorizations:
+            key = categorization.ticker_key
+            self.fund_categorizations[key] = categorization
+            self._tally(key, categorization)
+        
         self.categorized_funds = len(self.fund_categorizations)
-        self.high_confidence_funds = len([c for c in self.fund_categorizations.values() if c.asset_class_confidence >= 0.8])
-        self.updated_at = datetime.utcnow()
+        self.high_confidence_funds = self._high_confidence_count
+        self.updated_at_ns = time.time_ns()
     
     def get_next_fund_needing_input(self) -> Optional[str]:
         """Get next fund ticker that needs user input."""
@@ -303,19 +605,17 @@ class CategorizationSession(BaseModel):
     def mark_current_fund_complete(self):
         """Mark current fund as complete and advance to next."""
         self.current_fund_index += 1
-        self.updated_at = datetime.utcnow()
+        self.updated_at_ns = time.time_ns()
     
     def get_summary(self) -> Dict[str, Any]:
         """Get categorization summary."""
-        asset_class_counts = {}
-        total_confidence = 0.0
-        
-        for categorization in self.fund_categorizations.values():
-            asset_class = categorization.asset_class
-            asset_class_counts[asset_class] = asset_class_counts.get(asset_class, 0) + 1
-            total_confidence += categorization.asset_class_confidence
-        
-        avg_confidence = total_confidence / len(self.fund_categorizations) if self.fund_categorizations else 0.0
+        # Computed from fund_categorizations itself so in-place edits are always reflected
+        categorizations = self.fund_categorizations.values()
+        asset_class_counts = dict(Counter(c.asset_class for c in categorizations))
+        avg_confidence = (
+            sum(c.asset_class_confidence for c in categorizations) / len(categorizations)
+            if categorizations else 0.0
+        )
         
         return {
             "total_funds": self.total_funds,
@@ -333,13 +633,15 @@ class CategorizationSession(BaseModel):
 class CategoryQuestion(BaseModel):
     """Question for user about fund categorization."""
     
+    model_config = ConfigDict(extra="forbid", validate_assignment=False, use_enum_values=True)
+    
     # Question metadata
     question_id: str = Field(..., description="Unique question identifier")
     ticker: str = Field(..., description="Fund ticker this question is about")
     fund_name: str = Field(..., description="Fund name for context")
     
     # Question content
-    question_type: Literal["asset_class", "equity_region", "equity_style", "equity_size", "fixed_income_type", "fixed_income_duration"] = Field(..., description="Type of categorization question")
+    question_type: QuestionType = Field(..., description="Type of categorization question")
     question_text: str = Field(..., description="Human-readable question")
     
     # Answer options
@@ -356,8 +658,22 @@ class CategoryQuestion(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow, description="When question was created")
     priority: int = Field(1, description="Question priority (1=high, 2=medium, 3=low)")
     
+    # Metadata subtree of the chat message, built once per question
+    _chat_metadata: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the immutable parts of the chat message."""
+        self._chat_metadata = {
+            "question_type": self.question_type,
+            "priority": self.priority,
+            "allow_custom": self.allow_custom
+        }
+    
     def to_chat_message(self) -> Dict[str, Any]:
-        """Convert to chat message format."""
+        """Convert to chat message format.
+        
+        The ``metadata`` dict is shared between calls and must not be mutated.
+        """
         return {
             "type": "categorization_question",
             "question_id": self.question_id,
@@ -370,17 +686,15 @@ class CategoryQuestion(BaseModel):
                 "confidence": self.confidence_score,
                 "reasoning": self.reasoning
             },
-            "metadata": {
-                "question_type": self.question_type,
-                "priority": self.priority,
-                "allow_custom": self.allow_custom
-            }
+            "metadata": self._chat_metadata
         }
 
 
 class CategoryResponse(BaseModel):
     """User response to categorization question."""
     
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     question_id: str = Field(..., description="ID of question being answered")
     ticker: str = Field(..., description="Fund ticker")
     
@@ -422,26 +736,113 @@ class ChatResponse(BaseModel):
 
 
 # Utility functions for data conversion
+
+# CSV column names, interned so row lookups with interned keys compare by identity
+_COL_TICKER = sys.intern("Ticker")
+_COL_NAME = sys.intern("Name")
+_COL_ASSET_CLASS = sys.intern("Asset Class")
+_COL_EXPENSE_RATIO = sys.intern("Expense Ratio (%)")
+_COL_MORNINGSTAR = sys.intern("Morningstar Category")
+_COL_CONSERVATIVE = sys.intern("Conservative (%)")
+_COL_MOD_CONSERVATIVE = sys.intern("Mod. Conservative (%)")
+_COL_MODERATE = sys.intern("Moderate (%)")
+_COL_GROWTH = sys.intern("Growth (%)")
+_COL_AGGRESSIVE = sys.intern("Aggressive (%)")
+
+
+# Compiled-once validators for the ingest paths
+_PI_ADAPTER = TypeAdapter(PortfolioItem)
+_EFD_ADAPTER = TypeAdapter(ExtendedFundData)
+
+
+def _csv_float(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric CSV cell, treating empty values as missing."""
+    return float(value) if value else None
+
+
 def portfolio_item_from_csv_row(row: Dict[str, str]) -> PortfolioItem:
     """Create PortfolioItem from CSV row data."""
-    return PortfolioItem(
-        ticker=row.get("Ticker", ""),
-        name=row.get("Name", ""),
-        asset_class=row.get("Asset Class", ""),
-        expense_ratio=float(row.get("Expense Ratio (%)", 0)) if row.get("Expense Ratio (%)") else None,
-        morningstar_category=row.get("Morningstar Category"),
-        conservative_pct=float(row.get("Conservative (%)", 0)) if row.get("Conservative (%)") else None,
-        mod_conservative_pct=float(row.get("Mod. Conservative (%)", 0)) if row.get("Mod. Conservative (%)") else None,
-        moderate_pct=float(row.get("Moderate (%)", 0)) if row.get("Moderate (%)") else None,
-        growth_pct=float(row.get("Growth (%)", 0)) if row.get("Growth (%)") else None,
-        aggressive_pct=float(row.get("Aggressive (%)", 0)) if row.get("Aggressive (%)") else None,
-    )
+    get = row.get
+    return _PI_ADAPTER.validate_python({
+        "ticker": get(_COL_TICKER, ""),
+        "name": get(_COL_NAME, ""),
+        "asset_class": get(_COL_ASSET_CLASS, ""),
+        "expense_ratio": _csv_float(get(_COL_EXPENSE_RATIO)),
+        "morningstar_category": get(_COL_MORNINGSTAR),
+        "conservative_pct": _csv_float(get(_COL_CONSERVATIVE)),
+        "mod_conservative_pct": _csv_float(get(_COL_MOD_CONSERVATIVE)),
+        "moderate_pct": _csv_float(get(_COL_MODERATE)),
+        "growth_pct": _csv_float(get(_COL_GROWTH)),
+        "aggressive_pct": _csv_float(get(_COL_AGGRESSIVE)),
+    })
+
+
+# CSV column -> PortfolioItem field for numeric and text columns
+_CSV_NUMERIC_COLUMNS = {
+    _COL_EXPENSE_RATIO: "expense_ratio",
+    _COL_CONSERVATIVE: "conservative_pct",
+    _COL_MOD_CONSERVATIVE: "mod_conservative_pct",
+    _COL_MODERATE: "moderate_pct",
+    _COL_GROWTH: "growth_pct",
+    _COL_AGGRESSIVE: "aggressive_pct",
+}
+_CSV_TEXT_COLUMNS = {
+    _COL_TICKER: "ticker",
+    _COL_NAME: "name",
+    _COL_ASSET_CLASS: "asset_class",
+    _COL_MORNINGSTAR: "morningstar_category",
+}
+_CSV_REQUIRED_TEXT_FIELDS = {"ticker", "name", "asset_class"}
 
 
-def extend_fund_data(original: OriginalFundData, ticker: str = None, **kwargs) -> ExtendedFundData:
-    """Convert original FundData to ExtendedFundData with additional fields."""
-    # Convert original to dict
-    data = original.model_dump()
+def portfolio_items_from_dataframe(df: pd.DataFrame) -> List[PortfolioItem]:
+    """Create PortfolioItems for every row of a portfolio DataFrame.
+    
+    Numeric columns are coerced in one vectorized pass; values that cannot be
+    parsed become None instead of failing the row. Missing required text
+    values become empty strings so callers can filter incomplete rows.
+    """
+    n_rows = len(df)
+    columns: Dict[str, List[Any]] = {}
+    
+    for column, field_name in _CSV_TEXT_COLUMNS.items():
+        default = "" if field_name in _CSV_REQUIRED_TEXT_FIELDS else None
+        if column in df.columns:
+            values = df[column]
+            columns[field_name] = values.astype(str).where(values.notna(), default).tolist()
+        else:
+            columns[field_name] = [default] * n_rows
+    
+    for column, field_name in _CSV_NUMERIC_COLUMNS.items():
+        if column in df.columns:
+            numbers = pd.to_numeric(df[column], errors="coerce").astype(float)
+            columns[field_name] = numbers.astype(object).where(numbers.notna(), None).tolist()
+        else:
+            columns[field_name] = [None] * n_rows
+    
+    field_names = list(columns)
+    # Each item needs its own fields-set: pydantic mutates it on attribute assignment
+    return [
+        PortfolioItem.model_construct(_fields_set=set(field_names), **dict(zip(field_names, values)))
+        for values in zip(*columns.values())
+    ]
+
+
+def extend_fund_data(original: OriginalFundData, ticker: str = None, validate: bool = False, **kwargs) -> ExtendedFundData:
+    """Convert original FundData to ExtendedFundData with additional fields.
+    
+    ``original`` has already been validated, so by default the result is built
+    with ``model_construct`` and no validation runs. Extended fields passed in
+    ``kwargs`` must therefore already have their final types (``str`` ticker,
+    ``float`` scores, ``datetime`` timestamps). Pass ``validate=True`` when the
+    extra fields come from untrusted input.
+    """
+    # Copy the field values directly; FundData has no nested models to dump, but its
+    # holdings and allocation lists are copied so the two models don't share them
+    data = {
+        name: value.copy() if isinstance(value, (list, dict)) else value
+        for name, value in original.__dict__.items()
+    }
     
     # Add extended fields
     extended_fields = {
@@ -453,4 +854,8 @@ def extend_fund_data(original: OriginalFundData, ticker: str = None, **kwargs) -
     }
     
     data.update(extended_fields)
-    return ExtendedFundData(**data)
\ No newline at end of file
+    if validate:
+        return _EFD_ADAPTER.validate_python(data)
+    return ExtendedFundData.model_construct(
+        _fields_set=original.model_fields_set | extended_fields.keys(), **data
+    )
@@ -1,18 +1,179 @@
 """Advanced confidence scoring algorithms for fund categorization system."""
 
 import re
+import sys
+import bisect
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from functools import lru_cache
+from datetime import datetime
+from urllib.parse import urlsplit
 import numpy as np
-from collections import defaultdict, Counter
-import math
 
 logger = logging.getLogger(__name__)
 
+# Source type categories, checked in order; the first matching category wins
+_SOURCE_TYPE_PATTERNS = (
+    ("financial_data", re.compile("morningstar|yahoo|bloomberg")),
+    ("regulatory", re.compile(r"sec\.gov|regulatory")),
+    ("fund_company", re.compile("vanguard|ishares|fidelity")),
+    ("news", re.compile("news|reuters|wsj")),
+)
 
-@dataclass
+# Fund name keyword groups used for domain specificity
+_FUND_FAMILY_RE = re.compile("vanguard|ishares|fidelity|schwab")
+_FUND_TYPE_RE = re.compile("etf|index|mutual fund|trust")
+_MARKET_SEGMENT_RE = re.compile(r"total market|s&p 500|russell|msci")
+_GEO_RE = re.compile("international|emerging|global|europe|asia")
+_STYLE_RE = re.compile("value|growth|dividend|small cap|large cap")
+
+# Name and category keywords used for consistency and contradiction checks
+_EQUITY_WORDS_RE = re.compile("equity|stock")
+_EQUITY_SHARE_WORDS_RE = re.compile("equity|stock|shares")
+_FIXED_INCOME_WORDS_RE = re.compile("bond|treasury|fixed income")
+_INTERNATIONAL_WORDS_RE = re.compile("international|foreign|global")
+_EQUITY_CATEGORY_RE = re.compile("equity|stock|large|mid|small")
+_FIXED_INCOME_CATEGORY_RE = re.compile("bond|fixed|income")
+
+# Naive ISO-8601 timestamps as written by datetime.isoformat()
+_ISO_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?")
+
+# Data freshness decay: age cutoffs in hours and the score for each band
+_FRESHNESS_CUTOFFS_H = (1, 24, 168, 720)  # 1 hour, 1 day, 1 week, 1 month
+_FRESHNESS_SCORES = (1.0, 0.9, 0.7, 0.5)
+_STALE_FRESHNESS = 0.3
+
+# Default factor weights based on importance
+_W_SR = 0.20  # source_reliability
+_W_SD = 0.10  # source_diversity
+_W_DF = 0.05  # data_freshness
+_W_PM = 0.15  # pattern_match_score
+_W_PS = 0.10  # pattern_specificity
+_W_MA = 0.15  # method_agreement
+_W_HA = 0.10  # historical_accuracy
+_W_DC = 0.10  # data_completeness
+_W_DN = 0.10  # data_consistency
+_W_DS = 0.15  # domain_specificity
+_W_CC = 0.10  # contextual_coherence
+_W_TOTAL = _W_SR + _W_SD + _W_DF + _W_PM + _W_PS + _W_MA + _W_HA + _W_DC + _W_DN + _W_DS + _W_CC
+
+# Normalized default weights in ConfidenceFactors field order, for batch scoring
+_DEFAULT_WEIGHT_VECTOR = np.array(
+    [_W_SR, _W_SD, _W_DF, _W_PM, _W_PS, _W_MA, _W_HA, _W_DC, _W_DN, _W_DS, _W_CC],
+    dtype=np.float64
+) / _W_TOTAL
+
+# Confidence bonus per classification method
+_METHOD_BONUS = {
+    "known_fund": 0.1,
+    "morningstar": 0.05,
+    "rule_based": 0.0,
+    "research_based": -0.05,  # Slightly penalize less reliable methods
+}
+
+# Integer codes for asset classes, so hot branches compare ints rather than strings
+_ASSET_EQUITY, _ASSET_FI, _ASSET_CASH, _ASSET_ALT, _ASSET_UNK = range(5)
+_ASSET_CODES = {
+    "Equity": _ASSET_EQUITY,
+    "Fixed Income": _ASSET_FI,
+    "Cash": _ASSET_CASH,
+    "Alternatives": _ASSET_ALT,
+}
+
+# Sub-category presence bits in _ClsView.presence
+_EQUITY_SUBCATEGORY_BITS = 0b00111  # equity_region, equity_style, equity_size
+_FI_SUBCATEGORY_SHIFT = 3           # fixed_income_type, fixed_income_duration
+_POPCOUNT = tuple(bin(mask).count("1") for mask in range(1 << 5))
+
+# Pattern specificity from asset class clarity, indexed by asset code
+_ASSET_SPECIFICITY = (0.7, 0.7, 0.9, 0.6, 0.3)  # Cash is very specific
+
+# Explanation bands: score cutoffs and the label for each band
+_BAND_CUTOFFS = (0.4, 0.6, 0.8, 0.9)
+_BAND_LABELS = ("Very low confidence", "Low confidence", "Moderate confidence", "High confidence", "Very high confidence")
+
+# Explanation phrases: (factor, threshold, phrase); strengths fire above, concerns below
+_STRENGTH_FLAGS = (
+    ("source_reliability", 0.8, "reliable data sources"),
+    ("method_agreement", 0.7, "multiple methods agree"),
+    ("pattern_match_score", 0.8, "strong pattern match"),
+    ("data_completeness", 0.8, "comprehensive data available"),
+)
+_CONCERN_FLAGS = (
+    ("source_reliability", 0.5, "limited source reliability"),
+    ("data_completeness", 0.5, "incomplete data"),
+    ("data_consistency", 0.5, "inconsistent information"),
+)
+
+
+def _extract_host(source: str) -> str:
+    """Return the bare hostname of a source URL, or the source itself if it has none."""
+    
+    if "://" in source:
+        host = urlsplit(source).hostname or source
+    else:
+        host = source.partition("/")[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+class _ClsView(NamedTuple):
+    """The classification fields the scorer reads, fetched and lower-cased once."""
+    
+    asset_class: str
+    asset_code: int
+    ticker: str
+    fund_name_lc: str
+    reasoning_lc: str
+    method: Optional[str]
+    method_code: int
+    region: Optional[str]
+    style: Optional[str]
+    size: Optional[str]
+    fi_type: Optional[str]
+    fi_dur: Optional[str]
+    presence: int
+    alt_asset_classes: Tuple[Optional[str], ...]
+    
+    @classmethod
+    def from_dict(cls, classification_data: Dict[str, Any], method_codes: Dict[str, int]) -> "_ClsView":
+        get = classification_data.get
+        asset_class = get("asset_class") or ""
+        method = get("classification_method")
+        region, style, size = get("equity_region"), get("equity_style"), get("equity_size")
+        fi_type, fi_dur = get("fixed_income_type"), get("fixed_income_duration")
+        return cls(
+            asset_class,
+            _ASSET_CODES.get(asset_class, _ASSET_UNK),
+            get("ticker") or "",
+            (get("fund_name") or "").lower(),
+            (get("reasoning") or "").lower(),
+            method,
+            method_codes.get(method, len(method_codes)),
+            region,
+            style,
+            size,
+            fi_type,
+            fi_dur,
+            bool(region) | bool(style) << 1 | bool(size) << 2 | bool(fi_type) << 3 | bool(fi_dur) << 4,
+            tuple(alt.get("asset_class") for alt in get("alternative_classifications") or ())
+        )
+
+
+def _finalize(weighted: float, bonus: float, penalty: float) -> float:
+    """Apply the method bonus (capped at 1.0), then the consistency penalty (floored at 0.0).
+    
+    The cap comes before the penalty, so a penalty always lowers a capped score.
+    """
+    
+    return max(0.0, min(1.0, weighted * (1.0 + bonus)) - penalty)
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters fall back to __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ConfidenceFactors:
     """Factors contributing to confidence scoring."""
     
@@ -41,21 +202,21 @@ class ConfidenceFactors:
         """Calculate weighted confidence score."""
         
         if weights is None:
-            # Default weights based on importance
-            weights = {
-                "source_reliability": 0.20,
-                "source_diversity": 0.10,
-                "data_freshness": 0.05,
-                "pattern_match_score": 0.15,
-                "pattern_specificity": 0.10,
-                "method_agreement": 0.15,
-                "historical_accuracy": 0.10,
-                "data_completeness": 0.10,
-                "data_consistency": 0.10,
-                "domain_specificity": 0.15,
-                "contextual_coherence": 0.10
-            }
-        
+            return (
+                self.source_reliability * _W_SR +
+                self.source_diversity * _W_SD +
+                self.data_freshness * _W_DF +
+                self.pattern_match_score * _W_PM +
+                self.pattern_specificity * _W_PS +
+                self.method_agreement * _W_MA +
+                self.historical_accuracy * _W_HA +
+                self.data_completeness * _W_DC +
+                self.data_consistency * _W_DN +
+                self.domain_specificity * _W_DS +
+                self.contextual_coherence * _W_CC
+            ) / _W_TOTAL
+        
+        # Custom weights: only factors that exist contribute
         score = 0.0
         total_weight = 0.0
         
@@ -113,6 +274,33 @@ class ConfidenceScorer:
             "pattern_inference": 0.60,
             "fallback": 0.20
         }
+        
+        self._build_lookup_tables()
+        
+        # Classification-only factors, memoized per _ClsView
+        self._cached_classification_factors = lru_cache(maxsize=4096)(self._classification_factors)
+    
+    def invalidate(self) -> None:
+        """Rebuild derived lookups and drop memoized factors after the rating tables change."""
+        
+        self._build_lookup_tables()
+        self._cached_classification_factors.cache_clear()
+    
+    def _build_lookup_tables(self) -> None:
+        """Compile the source pattern and index the per-method tables by integer method code.
+        
+        The last slot of each method table holds the default for unknown methods.
+        """
+        
+        self._reliability_re = re.compile(
+            "|".join(re.escape(domain) for domain in self.source_reliability)
+        )
+        
+        methods = list(dict.fromkeys([*self.method_reliability, *self.historical_accuracy, *_METHOD_BONUS]))
+        self._method_codes = {method: code for code, method in enumerate(methods)}
+        self._method_reliability_table = tuple(self.method_reliability.get(m, 0.5) for m in methods) + (0.5,)
+        self._historical_accuracy_table = tuple(self.historical_accuracy.get(m, 0.5) for m in methods) + (0.5,)
+        self._method_bonus_table = tuple(_METHOD_BONUS.get(m, 0.0) for m in methods) + (0.0,)
     
     def calculate_classification_confidence(
         self, 
@@ -132,104 +320,163 @@ class ConfidenceScorer:
             Tuple of (confidence_score, confidence_factors)
         """
         
-        factors = ConfidenceFactors()
+        view = _ClsView.from_dict(classification_data, self._method_codes)
+        factors = ConfidenceFactors(*[
+            max(0.0, min(1.0, value))
+            for value in self._factor_values(view, research_data or {})
+        ])
         
-        # 1. Source reliability assessment
-        factors.source_reliability = self._assess_source_reliability(research_data or {})
+        confidence_score = _finalize(
+            factors.get_weighted_score(),
+            self._get_method_confidence_bonus(view),
+            self._view_factors(view)[-1]
+        )
         
-        # 2. Source diversity assessment  
-        factors.source_diversity = self._assess_source_diversity(research_data or {})
+        logger.debug(f"📊 Calculated confidence: {confidence_score:.3f} for {classification_data.get('ticker', 'unknown')}")
         
-        # 3. Data freshness assessment
-        factors.data_freshness = self._assess_data_freshness(research_data or {})
+        return confidence_score, factors
+    
+    def calculate_batch_confidence(
+        self,
+        classifications: List[Dict[str, Any]],
+        research_datas: Optional[List[Dict[str, Any]]] = None,
+        _now: Optional[datetime] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate confidence scores for many classifications at once.
         
-        # 4. Pattern matching strength
-        factors.pattern_match_score = self._assess_pattern_strength(classification_data)
+        Args:
+            classifications: Classification result data, one dict per fund
+            research_datas: Research data aligned with classifications
+            _now: Reference time for data freshness; defaults to the current local time
         
-        # 5. Pattern specificity
-        factors.pattern_specificity = self._assess_pattern_specificity(classification_data)
+        Returns:
+            Tuple of (confidence_scores, factor_matrix) where factor_matrix
+            has one row per fund in ConfidenceFactors field order
+        """
         
-        # 6. Method agreement
-        factors.method_agreement = self._assess_method_agreement(classification_data)
+        n = len(classifications)
+        if research_datas is None:
+            research_datas = [{}] * n
         
-        # 7. Historical accuracy
-        factors.historical_accuracy = self._assess_historical_accuracy(classification_data)
+        # One reference time for the whole batch
+        now = np.datetime64(datetime.now() if _now is None else _now, "us")
         
-        # 8. Data completeness
-        factors.data_completeness = self._assess_data_completeness(classification_data, research_data or {})
+        views = [_ClsView.from_dict(c, self._method_codes) for c in classifications]
+        factor_matrix = np.array(
+            [self._factor_values(v, r or {}, now) for v, r in zip(views, research_datas)],
+            dtype=np.float64
+        ).reshape(n, len(_DEFAULT_WEIGHT_VECTOR))
+        np.clip(factor_matrix, 0.0, 1.0, out=factor_matrix)
         
-        # 9. Data consistency
-        factors.data_consistency = self._assess_data_consistency(classification_data, research_data or {})
+        bonus = np.take(
+            self._method_bonus_table, np.fromiter((v.method_code for v in views), dtype=np.intp, count=n)
+        )
+        penalty = np.fromiter(
+            (self._view_factors(v)[-1] for v in views), dtype=np.float64, count=n
+        )
         
-        # 10. Domain specificity
-        factors.domain_specificity = self._assess_domain_specificity(classification_data)
+        # Vector form of _finalize
+        scores = np.clip(
+            np.minimum(1.0, (factor_matrix @ _DEFAULT_WEIGHT_VECTOR) * (1.0 + bonus)) - penalty, 0.0, None
+        )
         
-        # 11. Contextual coherence  
-        factors.contextual_coherence = self._assess_contextual_coherence(classification_data)
+        return scores, factor_matrix
+    
+    def _factor_values(
+        self, view: _ClsView, research_data: Dict[str, Any], _now: Optional[np.datetime64] = None
+    ) -> Tuple[float, ...]:
+        """Assess all confidence factors, in ConfidenceFactors field order.
         
-        # Calculate final weighted score
-        confidence_score = factors.get_weighted_score()
+        Values are unclamped; callers clip them to [0.0, 1.0].
+        """
         
-        # Apply method-specific adjustments
-        method_bonus = self._get_method_confidence_bonus(classification_data)
-        confidence_score = min(1.0, confidence_score * (1.0 + method_bonus))
+        (
+            pattern_strength, pattern_specificity, method_agreement,
+            historical_accuracy, domain_specificity, contextual_coherence, _
+        ) = self._view_factors(view)
+        
+        # Lower-case the research sources once for both source assessors
+        sources_lc = [source.lower() for source in research_data.get("research_sources", [])]
+        
+        return (
+            self._assess_source_reliability(sources_lc),
+            self._assess_source_diversity(sources_lc),
+            self._assess_data_freshness(research_data, _now),
+            pattern_strength,
+            pattern_specificity,
+            method_agreement,
+            historical_accuracy,
+            self._assess_data_completeness(view, research_data),
+            self._assess_data_consistency(view, research_data),
+            domain_specificity,
+            contextual_coherence
+        )
+    
+    def _view_factors(self, view: _ClsView) -> Tuple[float, ...]:
+        """Memoized _classification_factors; views with unhashable field values are scored directly."""
         
-        # Apply consistency penalties
-        consistency_penalty = self._calculate_consistency_penalty(classification_data)
-        confidence_score = max(0.0, confidence_score - consistency_penalty)
+        try:
+            return self._cached_classification_factors(view)
+        except TypeError:
+            return self._classification_factors(view)
+    
+    def _classification_factors(self, view: _ClsView) -> Tuple[float, ...]:
+        """Assess the factors that depend only on the classification, plus its consistency penalty.
         
-        logger.debug(f"📊 Calculated confidence: {confidence_score:.3f} for {classification_data.get('ticker', 'unknown')}")
+        Research-dependent factors are left out since freshness moves with the clock.
+        """
         
-        return confidence_score, factors
+        return (
+            self._assess_pattern_strength(view),
+            self._assess_pattern_specificity(view),
+            self._assess_method_agreement(view),
+            self._assess_historical_accuracy(view),
+            self._assess_domain_specificity(view),
+            self._assess_contextual_coherence(view),
+            self._calculate_consistency_penalty(view)
+        )
     
-    def _assess_source_reliability(self, research_data: Dict[str, Any]) -> float:
-        """Assess reliability of research sources."""
+    def _assess_source_reliability(self, sources: List[str]) -> float:
+        """Assess reliability of lower-cased research sources."""
         
-        sources = research_data.get("research_sources", [])
         if not sources:
             return 0.3  # Default for no sources
         
-        reliabilities = []
-        
-        for source in sources:
-            source_lower = source.lower()
-            
-            # Check against known source reliability ratings
-            reliability = 0.5  # Default
-            
-            for domain, rating in self.source_reliability.items():
-                if domain in source_lower:
-                    reliability = rating
-                    break
-            
-            reliabilities.append(reliability)
+        # Rate each distinct source once; duplicates still count toward the average
+        ratings = {source: self._lookup_source_reliability(source) for source in dict.fromkeys(sources)}
+        reliabilities = np.empty(len(sources), dtype=np.float64)
+        for i, source in enumerate(sources):
+            reliabilities[i] = ratings[source]
         
         # Use weighted average (more sources = slightly higher confidence)
-        avg_reliability = np.mean(reliabilities)
+        avg_reliability = float(reliabilities.mean())
         source_diversity_bonus = min(0.1, len(sources) * 0.02)  # Up to 10% bonus
         
-        return min(1.0, avg_reliability + source_diversity_bonus)
+        return avg_reliability + source_diversity_bonus
     
-    def _assess_source_diversity(self, research_data: Dict[str, Any]) -> float:
-        """Assess diversity of research sources."""
+    def _lookup_source_reliability(self, source_lower: str) -> float:
+        """Rate one lower-cased source: exact host first, then partial matches such as "tavily"."""
+        
+        reliability = self.source_reliability.get(_extract_host(source_lower))
+        if reliability is None:
+            match = self._reliability_re.search(source_lower)
+            reliability = self.source_reliability[match.group(0)] if match else 0.5
+        return reliability
+    
+    def _assess_source_diversity(self, sources: List[str]) -> float:
+        """Assess diversity of lower-cased research sources."""
         
-        sources = research_data.get("research_sources", [])
         if len(sources) <= 1:
             return 0.0 if len(sources) == 0 else 0.3
         
-        # Analyze source types
+        # Analyze source types of the distinct sources
         source_types = set()
-        for source in sources:
-            source_lower = source.lower()
-            
-            if any(domain in source_lower for domain in ["morningstar", "yahoo", "bloomberg"]):
-                source_types.add("financial_data")
-            elif any(domain in source_lower for domain in ["sec.gov", "regulatory"]):
-                source_types.add("regulatory")
-            elif any(domain in source_lower for domain in ["vanguard", "ishares", "fidelity"]):
-                source_types.add("fund_company")
-            elif any(domain in source_lower for domain in ["news", "reuters", "wsj"]):
-                source_types.add("news")
+        for source in dict.fromkeys(sources):
+            for source_type, pattern in _SOURCE_TYPE_PATTERNS:
+                if pattern.search(source):
+                    source_types.add(source_type)
+                    break
             else:
                 source_types.add("general")
         
@@ -239,50 +486,67 @@ class ConfidenceScorer:
         # Bonus for multiple sources of same type (validation)
         total_sources_bonus = min(0.2, (len(sources) - 1) * 0.05)
         
-        return min(1.0, diversity_score + total_sources_bonus)
+        return diversity_score + total_sources_bonus
     
-    def _assess_data_freshness(self, research_data: Dict[str, Any]) -> float:
-        """Assess freshness of research data."""
+    def _assess_data_freshness(self, research_data: Dict[str, Any], _now: Optional[np.datetime64] = None) -> float:
+        """Assess freshness of research data relative to _now (default: the current local time)."""
         
         data_points = research_data.get("data_points", {})
         if not data_points:
             return 0.5  # Neutral for no timestamp data
         
-        now = datetime.now()
-        freshness_scores = []
+        timestamps = []
+        unparsed = 0
         
-        for key, data_point in data_points.items():
+        for data_point in data_points.values():
             if isinstance(data_point, dict) and "extraction_timestamp" in data_point:
+                timestamp = data_point["extraction_timestamp"]
+                if isinstance(timestamp, str) and _ISO_TIMESTAMP_RE.fullmatch(timestamp):
+                    timestamps.append(timestamp)
+                    continue
+                # Other forms fromisoformat accepts (e.g. "2024-01-01T10", "20240101T1000")
+                try:
+                    parsed_dt = datetime.fromisoformat(timestamp)
+                except (TypeError, ValueError):
+                    parsed_dt = None
+                if parsed_dt is not None and parsed_dt.tzinfo is None:
+                    timestamps.append(parsed_dt.isoformat())
+                else:
+                    unparsed += 1  # invalid, or tz-aware and not comparable with the naive local now
+        
+        try:
+            parsed = np.array(timestamps, dtype="datetime64[us]")
+        except ValueError:
+            # Well-formed but out-of-range values (e.g. month 13): drop them one by one
+            valid = []
+            for timestamp in timestamps:
                 try:
-                    timestamp = datetime.fromisoformat(data_point["extraction_timestamp"])
-                    age_hours = (now - timestamp).total_seconds() / 3600
-                    
-                    # Freshness decay function
-                    if age_hours < 1:
-                        freshness = 1.0
-                    elif age_hours < 24:
-                        freshness = 0.9
-                    elif age_hours < 168:  # 1 week
-                        freshness = 0.7
-                    elif age_hours < 720:  # 1 month
-                        freshness = 0.5
-                    else:
-                        freshness = 0.3
-                    
-                    freshness_scores.append(freshness)
-                except:
-                    freshness_scores.append(0.5)
-        
-        return np.mean(freshness_scores) if freshness_scores else 0.5
-    
-    def _assess_pattern_strength(self, classification_data: Dict[str, Any]) -> float:
+                    valid.append(np.datetime64(timestamp, "us"))
+                except ValueError:
+                    unparsed += 1
+            parsed = np.array(valid, dtype="datetime64[us]")
+        
+        if not len(parsed) and not unparsed:
+            return 0.5
+        
+        now = np.datetime64(datetime.now() if _now is None else _now, "us")
+        age_hours = (now - parsed).astype(np.int64) / 3.6e9
+        freshness = np.select(
+            [age_hours < cutoff for cutoff in _FRESHNESS_CUTOFFS_H],
+            _FRESHNESS_SCORES,
+            default=_STALE_FRESHNESS
+        )
+        
+        # Unparseable timestamps count as neutral
+        return (freshness.sum() + 0.5 * unparsed) / (len(freshness) + unparsed)
+    
+    def _assess_pattern_strength(self, view: _ClsView) -> float:
         """Assess strength of pattern matching."""
         
-        method = classification_data.get("classification_method", "unknown")
-        reasoning = classification_data.get("reasoning", "").lower()
+        reasoning = view.reasoning_lc
         
         # Base score from method reliability
-        base_score = self.method_reliability.get(method, 0.5)
+        base_score = self._method_reliability_table[view.method_code]
         
         # Pattern strength indicators
         strength_indicators = 0.0
@@ -299,58 +563,40 @@ class ConfidenceScorer:
             strength_indicators += 0.05
         
         # Ticker-specific patterns
-        ticker = classification_data.get("ticker", "")
+        ticker = view.ticker
         if ticker:
             if re.match(r"^V[A-Z]{2,3}$", ticker):  # Vanguard pattern
                 strength_indicators += 0.1
             elif re.match(r"^I[A-Z]{2,4}$", ticker):  # iShares pattern  
                 strength_indicators += 0.1
         
-        return min(1.0, base_score + strength_indicators)
+        return base_score + strength_indicators
     
-    def _assess_pattern_specificity(self, classification_data: Dict[str, Any]) -> float:
+    def _assess_pattern_specificity(self, view: _ClsView) -> float:
         """Assess specificity of classification patterns."""
         
-        asset_class = classification_data.get("asset_class", "")
-        sub_categories = 0
-        
         # Count filled sub-categories
-        for field in ["equity_region", "equity_style", "equity_size", "fixed_income_type", "fixed_income_duration"]:
-            if classification_data.get(field):
-                sub_categories += 1
+        sub_categories = _POPCOUNT[view.presence]
         
         # Base specificity from asset class clarity
-        asset_class_specificity = {
-            "Equity": 0.7,
-            "Fixed Income": 0.7,
-            "Cash": 0.9,  # Very specific
-            "Alternatives": 0.6
-        }.get(asset_class, 0.3)
+        asset_class_specificity = _ASSET_SPECIFICITY[view.asset_code]
         
         # Bonus for sub-category specificity
         sub_category_bonus = min(0.3, sub_categories * 0.1)
         
-        return min(1.0, asset_class_specificity + sub_category_bonus)
+        return asset_class_specificity + sub_category_bonus
     
-    def _assess_method_agreement(self, classification_data: Dict[str, Any]) -> float:
+    def _assess_method_agreement(self, view: _ClsView) -> float:
         """Assess agreement between different classification methods."""
         
-        alternatives = classification_data.get("alternative_classifications", [])
+        alternatives = view.alt_asset_classes
         
         if not alternatives:
             return 0.5  # Neutral when no alternatives
         
-        primary_asset_class = classification_data.get("asset_class")
-        
         # Count how many alternatives agree with primary classification
-        agreements = 0
-        total_alternatives = len(alternatives)
-        
-        for alt in alternatives:
-            if alt.get("asset_class") == primary_asset_class:
-                agreements += 1
-        
-        agreement_ratio = agreements / total_alternatives if total_alternatives > 0 else 0.5
+        agreements = alternatives.count(view.asset_class)
+        agreement_ratio = agreements / len(alternatives)
         
         # Bonus for having multiple methods agree
         consensus_bonus = 0.0
@@ -359,25 +605,18 @@ class ConfidenceScorer:
         elif agreement_ratio >= 0.6:
             consensus_bonus = 0.1
         
-        return min(1.0, agreement_ratio + consensus_bonus)
+        return agreement_ratio + consensus_bonus
     
-    def _assess_historical_accuracy(self, classification_data: Dict[str, Any]) -> float:
+    def _assess_historical_accuracy(self, view: _ClsView) -> float:
         """Assess historical accuracy of classification method."""
         
-        method = classification_data.get("classification_method", "unknown")
-        return self.historical_accuracy.get(method, 0.5)
+        return self._historical_accuracy_table[view.method_code]
     
-    def _assess_data_completeness(self, classification_data: Dict[str, Any], research_data: Dict[str, Any]) -> float:
+    def _assess_data_completeness(self, view: _ClsView, research_data: Dict[str, Any]) -> float:
         """Assess completeness of available data."""
         
         # Key fields that should be present
-        important_fields = [
-            "asset_class",
-            "ticker",
-            "fund_name",
-            "classification_method",
-            "reasoning"
-        ]
+        important_fields = (view.asset_class, view.ticker, view.fund_name_lc, view.method, view.reasoning_lc)
         
         # Research data fields
         research_fields = [
@@ -386,7 +625,7 @@ class ConfidenceScorer:
             "holdings_text"
         ]
         
-        filled_important = sum(1 for field in important_fields if classification_data.get(field))
+        filled_important = sum(1 for value in important_fields if value)
         completeness_core = filled_important / len(important_fields)
         
         # Research data completeness
@@ -395,7 +634,7 @@ class ConfidenceScorer:
         completeness_research = filled_research / len(research_fields) if research_fields else 0.0
         
         # Sub-category completeness based on asset class
-        sub_completeness = self._assess_subcategory_completeness(classification_data)
+        sub_completeness = self._assess_subcategory_completeness(view)
         
         # Weighted combination
         overall_completeness = (
@@ -404,28 +643,24 @@ class ConfidenceScorer:
             sub_completeness * 0.2
         )
         
-        return min(1.0, overall_completeness)
+        return overall_completeness
     
-    def _assess_subcategory_completeness(self, classification_data: Dict[str, Any]) -> float:
+    def _assess_subcategory_completeness(self, view: _ClsView) -> float:
         """Assess completeness of sub-categorization."""
         
-        asset_class = classification_data.get("asset_class", "")
+        asset_code = view.asset_code
         
-        if asset_class == "Equity":
-            equity_fields = ["equity_region", "equity_style", "equity_size"]
-            filled = sum(1 for field in equity_fields if classification_data.get(field))
-            return filled / len(equity_fields)
+        if asset_code == _ASSET_EQUITY:
+            return _POPCOUNT[view.presence & _EQUITY_SUBCATEGORY_BITS] / 3
         
-        elif asset_class == "Fixed Income":
-            fixed_income_fields = ["fixed_income_type", "fixed_income_duration"]
-            filled = sum(1 for field in fixed_income_fields if classification_data.get(field))
-            return filled / len(fixed_income_fields)
+        elif asset_code == _ASSET_FI:
+            return _POPCOUNT[view.presence >> _FI_SUBCATEGORY_SHIFT] / 2
         
         else:
             # Cash and Alternatives don't need sub-categories
             return 1.0
     
-    def _assess_data_consistency(self, classification_data: Dict[str, Any], research_data: Dict[str, Any]) -> float:
+    def _assess_data_consistency(self, view: _ClsView, research_data: Dict[str, Any]) -> float:
         """Assess consistency of data across sources."""
         
         data_points = research_data.get("data_points", {})
@@ -437,12 +672,12 @@ class ConfidenceScorer:
         # Check morningstar category consistency with asset class
         if "morningstar_category" in data_points:
             morningstar_cat = data_points["morningstar_category"]["value"].lower()
-            asset_class = classification_data.get("asset_class", "").lower()
+            asset_class = view.asset_class.lower()
             
             if asset_class == "equity":
-                consistent = any(keyword in morningstar_cat for keyword in ["equity", "stock", "large", "mid", "small"])
+                consistent = bool(_EQUITY_CATEGORY_RE.search(morningstar_cat))
             elif asset_class == "fixed income":
-                consistent = any(keyword in morningstar_cat for keyword in ["bond", "fixed", "income"])
+                consistent = bool(_FIXED_INCOME_CATEGORY_RE.search(morningstar_cat))
             else:
                 consistent = True  # Can't easily check others
                 
@@ -457,111 +692,86 @@ class ConfidenceScorer:
                 consistency_checks.append(1.0 if reasonable else 0.5)
         
         # Return average consistency
-        return np.mean(consistency_checks) if consistency_checks else 0.5
+        return sum(consistency_checks) / len(consistency_checks) if consistency_checks else 0.5
     
-    def _assess_domain_specificity(self, classification_data: Dict[str, Any]) -> float:
+    def _assess_domain_specificity(self, view: _ClsView) -> float:
         """Assess domain-specific knowledge application."""
         
-        ticker = classification_data.get("ticker", "")
-        fund_name = classification_data.get("fund_name", "").lower()
-        reasoning = classification_data.get("reasoning", "").lower()
+        fund_name = view.fund_name_lc
         
         domain_score = 0.5  # Base score
         
         # Fund family recognition
-        if any(family in fund_name for family in ["vanguard", "ishares", "fidelity", "schwab"]):
+        if _FUND_FAMILY_RE.search(fund_name):
             domain_score += 0.1
         
         # Fund type recognition in name
-        if any(type_word in fund_name for type_word in ["etf", "index", "mutual fund", "trust"]):
+        if _FUND_TYPE_RE.search(fund_name):
             domain_score += 0.1
         
         # Market segment recognition
-        if any(segment in fund_name for segment in ["total market", "s&p 500", "russell", "msci"]):
+        if _MARKET_SEGMENT_RE.search(fund_name):
             domain_score += 0.1
         
         # Geographic recognition
-        if any(geo in fund_name for geo in ["international", "emerging", "global", "europe", "asia"]):
+        if _GEO_RE.search(fund_name):
             domain_score += 0.1
         
         # Sector/style recognition
-        if any(style in fund_name for style in ["value", "growth", "dividend", "small cap", "large cap"]):
+        if _STYLE_RE.search(fund_name):
             domain_score += 0.1
         
-        return min(1.0, domain_score)
+        return domain_score
     
-    def _assess_contextual_coherence(self, classification_data: Dict[str, Any]) -> float:
+    def _assess_contextual_coherence(self, view: _ClsView) -> float:
         """Assess coherence of classification within context."""
         
-        asset_class = classification_data.get("asset_class", "")
-        sub_categories = {}
-        
-        # Gather sub-categories
-        if asset_class == "Equity":
-            sub_categories = {
-                "region": classification_data.get("equity_region"),
-                "style": classification_data.get("equity_style"), 
-                "size": classification_data.get("equity_size")
-            }
-        elif asset_class == "Fixed Income":
-            sub_categories = {
-                "type": classification_data.get("fixed_income_type"),
-                "duration": classification_data.get("fixed_income_duration")
-            }
+        asset_code = view.asset_code
         
         # Check logical coherence
         coherence_score = 0.7  # Base coherence
         
         # Asset class and sub-category coherence
-        if asset_class == "Equity" and sub_categories.get("region") == "US":
+        if asset_code == _ASSET_EQUITY and view.region == "US":
             coherence_score += 0.1  # US equity is common and coherent
         
-        if asset_class == "Fixed Income" and sub_categories.get("type") == "Government":
+        if asset_code == _ASSET_FI and view.fi_type == "Government":
             coherence_score += 0.1  # Government bonds are coherent category
         
         # Check for contradictions
-        fund_name = classification_data.get("fund_name", "").lower()
+        fund_name = view.fund_name_lc
         
-        if asset_class == "Equity" and "bond" in fund_name:
+        if asset_code == _ASSET_EQUITY and "bond" in fund_name:
             coherence_score -= 0.3  # Contradiction
-        elif asset_class == "Fixed Income" and any(word in fund_name for word in ["equity", "stock"]):
+        elif asset_code == _ASSET_FI and _EQUITY_WORDS_RE.search(fund_name):
             coherence_score -= 0.3  # Contradiction
         
-        return max(0.0, min(1.0, coherence_score))
+        return coherence_score
     
-    def _get_method_confidence_bonus(self, classification_data: Dict[str, Any]) -> float:
+    def _get_method_confidence_bonus(self, view: _ClsView) -> float:
         """Get confidence bonus based on classification method."""
         
-        method = classification_data.get("classification_method", "")
-        
-        bonuses = {
-            "known_fund": 0.1,
-            "morningstar": 0.05,
-            "rule_based": 0.0,
-            "research_based": -0.05,  # Slightly penalize less reliable methods
-        }
-        
-        return bonuses.get(method, 0.0)
+        return self._method_bonus_table[view.method_code]
     
-    def _calculate_consistency_penalty(self, classification_data: Dict[str, Any]) -> float:
+    def _calculate_consistency_penalty(self, view: _ClsView) -> float:
         """Calculate penalty for inconsistent data."""
         
         penalty = 0.0
         
         # Check for obvious inconsistencies
-        asset_class = classification_data.get("asset_class", "")
-        fund_name = classification_data.get("fund_name", "").lower()
+        asset_code = view.asset_code
+        fund_name = view.fund_name_lc
         
         # Name-classification mismatches
-        if asset_class == "Fixed Income" and any(word in fund_name for word in ["equity", "stock", "shares"]):
+        if asset_code == _ASSET_FI and _EQUITY_SHARE_WORDS_RE.search(fund_name):
             penalty += 0.2
-        elif asset_class == "Equity" and any(word in fund_name for word in ["bond", "treasury", "fixed income"]):
+        elif asset_code == _ASSET_EQUITY and _FIXED_INCOME_WORDS_RE.search(fund_name):
             penalty += 0.2
         
         # Sub-category inconsistencies
-        if asset_class == "Equity":
-            region = classification_data.get("equity_region")
-            if region == "US" and any(word in fund_name for word in ["international", "foreign", "global"]):
+        if asset_code == _ASSET_EQUITY:
+            region = view.region
+            if region == "US" and _INTERNATIONAL_WORDS_RE.search(fund_name):
                 penalty += 0.1
             elif region == "International" and "us " in fund_name:
                 penalty += 0.1
@@ -574,50 +784,30 @@ class ConfidenceScorer:
         if not classifications:
             return {"overall": 0.0, "average": 0.0, "min": 0.0, "max": 0.0}
         
-        confidences = [c.get("asset_class_confidence", 0.0) for c in classifications]
+        confidences = np.fromiter(
+            (c.get("asset_class_confidence", 0.0) for c in classifications),
+            dtype=np.float64,
+            count=len(classifications)
+        )
+        mean = float(confidences.mean())
         
         return {
-            "overall": np.mean(confidences),
-            "average": np.mean(confidences),
-            "min": np.min(confidences),
-            "max": np.max(confidences),
-            "std": np.std(confidences),
-            "high_confidence_ratio": len([c for c in confidences if c >= 0.8]) / len(confidences)
+            "overall": mean,
+            "average": mean,
+            "min": float(confidences.min()),
+            "max": float(confidences.max()),
+            "std": float(confidences.std()),
+            "high_confidence_ratio": float((confidences >= 0.8).mean())
         }
     
     def get_confidence_explanation(self, confidence_score: float, factors: ConfidenceFactors) -> str:
         """Generate human-readable explanation of confidence score."""
         
-        explanations = []
+        explanations = [_BAND_LABELS[bisect.bisect_right(_BAND_CUTOFFS, confidence_score)]]
         
-        if confidence_score >= 0.9:
-            explanations.append("Very high confidence")
-        elif confidence_score >= 0.8:
-            explanations.append("High confidence")
-        elif confidence_score >= 0.6:
-            explanations.append("Moderate confidence")
-        elif confidence_score >= 0.4:
-            explanations.append("Low confidence")
-        else:
-            explanations.append("Very low confidence")
-        
-        # Add key contributing factors
-        if factors.source_reliability > 0.8:
-            explanations.append("reliable data sources")
-        if factors.method_agreement > 0.7:
-            explanations.append("multiple methods agree")
-        if factors.pattern_match_score > 0.8:
-            explanations.append("strong pattern match")
-        if factors.data_completeness > 0.8:
-            explanations.append("comprehensive data available")
-        
-        # Add concerns
-        if factors.source_reliability < 0.5:
-            explanations.append("limited source reliability")
-        if factors.data_completeness < 0.5:
-            explanations.append("incomplete data")
-        if factors.data_consistency < 0.5:
-            explanations.append("inconsistent information")
+        # Add key contributing factors, then concerns
+        explanations.extend(phrase for factor, threshold, phrase in _STRENGTH_FLAGS if getattr(factors, factor) > threshold)
+        explanations.extend(phrase for factor, threshold, phrase in _CONCERN_FLAGS if getattr(factors, factor) < threshold)
         
         return " - ".join(explanations)
 
@@ -8,12 +8,202 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from itertools import islice
 import asyncio
-from dataclasses import dataclass, asdict
+import atexit
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstd = None
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+    xxhash = None
 
 logger = logging.getLogger(__name__)
 
+# One-byte format markers prefixed to stored values; unprefixed blobs are legacy pickles
+_MSGPACK_MARKER = b"M"
+_PICKLE_MARKER = b"P"
+_ZSTD_MARKER = b"Z"  # wraps one of the above, compressed
+
+# Stored values larger than this are zstd-compressed when zstandard is installed.
+# Compression contexts aren't thread-safe and values are (de)compressed on the database
+# thread, the event loop and in close(), so each thread gets its own pair.
+_COMPRESS_MIN_SIZE = 512
+_zstd_local = threading.local()
+
+
+def _zstd_contexts() -> Tuple["zstd.ZstdCompressor", "zstd.ZstdDecompressor"]:
+    """Return this thread's zstd compressor and decompressor, creating them on first use."""
+    contexts = getattr(_zstd_local, "contexts", None)
+    if contexts is None:
+        contexts = _zstd_local.contexts = (zstd.ZstdCompressor(level=3), zstd.ZstdDecompressor())
+    return contexts
+
+
+# Background writer: wait this long for concurrent set() calls to coalesce,
+# then write at most this many rows per transaction
+_WRITE_BATCH_DELAY = 0.05
+_WRITE_BATCH_SIZE = 256
+
+# Seconds between background sweeps of expired entries
+_CLEANUP_INTERVAL = 300
+
+# Per-agent in-process result cache in CacheableResearchMixin, oldest dropped first
+_LOCAL_RESULTS_SIZE = 1024
+
+# Statements run on every read/write, kept as constants so each connection's
+# statement cache reuses one compiled copy
+_GET_ENTRY_SQL = """
+    SELECT value, created_at, expires_at, access_count, tags, size_bytes
+    FROM cache_entries 
+    WHERE key = ? AND expires_at > ?
+"""
+
+_RECORD_HITS_SQL = """
+    UPDATE cache_entries
+    SET access_count = access_count + ?, last_accessed = MAX(last_accessed, ?)
+    WHERE key = ?
+"""
+
+_INSERT_ENTRY_SQL = """
+    INSERT OR REPLACE INTO cache_entries 
+    (key, value, created_at, expires_at, access_count, last_accessed, tags, size_bytes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_TAG_SQL = "INSERT OR IGNORE INTO cache_tags (key, tag) VALUES (?, ?)"
+_DELETE_ENTRY_SQL = "DELETE FROM cache_entries WHERE key = ?"
+_DELETE_TAGS_SQL = "DELETE FROM cache_tags WHERE key = ?"
+
+_DELETE_EXPIRED_TAGS_SQL = """
+    DELETE FROM cache_tags
+    WHERE key IN (SELECT key FROM cache_entries WHERE expires_at <= ?)
+"""
+_DELETE_EXPIRED_ENTRIES_SQL = "DELETE FROM cache_entries WHERE expires_at <= ?"
+_EXPIRED_TOTALS_SQL = "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_entries WHERE expires_at <= ?"
+
+# Per-connection SQLite settings; journal_mode=WAL is persisted in the database file itself
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",      # fsync at WAL checkpoints, not on every commit
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=10737418240",   # up to 10GB memory-mapped reads
+    "PRAGMA cache_size=-65536",       # 64MB page cache
+    "PRAGMA busy_timeout=30000",      # wait up to 30s on a locked database
+)
+
+
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply the per-connection PRAGMAs."""
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+def _now_millis() -> int:
+    """Current time as unix milliseconds, the on-disk timestamp format."""
+    return int(time.time() * 1000)
+
+
+def _to_millis(dt: datetime) -> int:
+    """Convert a naive local datetime to unix milliseconds."""
+    return int(dt.timestamp() * 1000)
+
+
+def _from_millis(ms: int) -> datetime:
+    """Convert unix milliseconds back to a naive local datetime."""
+    return datetime.fromtimestamp(ms / 1000)
+
+
+# Argument types hashed directly, each with a tag byte so 1 and "1" get different keys
+_FAST_KEY_TYPES = {str: b"s", int: b"i", bytes: b"b"}
+
+
+def _compute_cache_key(args: Tuple, kwargs_items: Tuple) -> str:
+    """Hash positional args and sorted kwargs items into a 32-char hex key."""
+    h = hashlib.blake2b(digest_size=16)
+    if not kwargs_items and all(type(arg) in _FAST_KEY_TYPES for arg in args):
+        # Common shape, e.g. ("fund_research", "AAPL", "comprehensive"): skip JSON
+        for arg in args:
+            data = arg if type(arg) is bytes else str(arg).encode()
+            h.update(_FAST_KEY_TYPES[type(arg)] + str(len(data)).encode() + b":" + data)
+    else:
+        key_data = {
+            "args": args,
+            "kwargs": kwargs_items
+        }
+        h.update(json.dumps(key_data, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _cached_cache_key(args: Tuple, kwargs_items: Tuple) -> str:
+    """Memoized _compute_cache_key for hashable arguments."""
+    return _compute_cache_key(args, kwargs_items)
+
+
+# Negative-lookup Bloom filter: ~10 bits and 7 probes per key give ~1% false positives
+_BLOOM_BITS_PER_KEY = 10
+_BLOOM_HASHES = 7
+_BLOOM_MIN_CAPACITY = 100_000
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over cache keys.
+    
+    Membership can give false positives but never false negatives, so a key that
+    is not in the filter is certainly not on disk. Keys can't be removed; the cache
+    rebuilds the filter after expired entries are cleaned up or once it fills up.
+    """
+    
+    __slots__ = ("capacity", "num_bits", "bits", "count")
+    
+    def __init__(self, capacity: int = 0):
+        self.capacity = max(capacity, _BLOOM_MIN_CAPACITY)
+        self.num_bits = self.capacity * _BLOOM_BITS_PER_KEY
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, key: str):
+        # Double hashing: derive every probe from the two halves of one digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(_BLOOM_HASHES)]
+    
+    def add(self, key: str):
+        bits = self.bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+    
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+    
+    def is_full(self) -> bool:
+        return self.count > self.capacity
+
 
 @dataclass
 class CacheEntry:
@@ -26,6 +216,7 @@ class CacheEntry:
     last_accessed: datetime
     tags: List[str]
     size_bytes: int
+    visited: bool = False  # SIEVE bit: hit since the eviction hand last passed
     
     def is_expired(self) -> bool:
         """Check if entry is expired."""
@@ -63,13 +254,48 @@ class ResearchDataCache:
         self.max_disk_size = max_disk_size
         self.default_ttl = default_ttl
         
+        # One persistent connection per thread, created on first use
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        
+        # Blocking database work runs here, off the event loop; a single worker
+        # keeps writes and deletes in submission order
+        self._db_executor: Optional[ThreadPoolExecutor] = None
+        
         # In-memory cache for frequently accessed items
         self.memory_cache: Dict[str, CacheEntry] = {}
         self.memory_size = 0
         
+        # SIEVE eviction queue, oldest first, split at the hand: keys the hand has
+        # already passed this sweep, and keys from the hand up to the newest
+        self._sieve_swept: OrderedDict[str, None] = OrderedDict()
+        self._sieve_ahead: OrderedDict[str, None] = OrderedDict()
+        
+        # Rows accepted by set() but not yet written by the background writer, by key
+        self._pending_writes: Dict[str, Tuple] = {}
+        self._writer_task: Optional[asyncio.Task] = None
+        self._write_wakeup: Optional[asyncio.Event] = None
+        
+        # Disk hits not yet recorded in access_count/last_accessed: key -> (count, last hit ms)
+        self._pending_hits: Dict[str, Tuple[int, int]] = {}
+        
+        # Periodic expiry sweep, started on the first running event loop that uses the cache
+        self._cleanup_task: Optional[asyncio.Task] = None
+        
         # Initialize database
         self._init_database()
         
+        # Running totals of rows on disk, seeded once here and kept current by the
+        # write/delete/cleanup paths so get_stats() doesn't scan the table
+        with self._get_db_connection() as conn:
+            row = conn.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_entries").fetchone()
+        self._disk_entries, self._disk_size = row[0], row[1]
+        
+        # Keys that may be on disk; get() skips the database for anything else
+        self._bloom = self._build_bloom_sync()
+        self._bloom_rebuild_task: Optional[asyncio.Task] = None
+        
         # Statistics
         self.stats = {
             "hits": 0,
@@ -80,97 +306,240 @@ class ResearchDataCache:
             "cleanups": 0
         }
         
+        try:
+            self._ensure_cleanup_task()
+        except RuntimeError:
+            pass  # No running loop yet (e.g. the module-level instance); set() starts it
+        
         logger.info(f"📦 Initialized ResearchDataCache at {self.cache_dir}")
     
     def _init_database(self):
         """Initialize SQLite database for persistent cache."""
         
         with sqlite3.connect(self.db_path) as conn:
+            # WAL lets readers proceed while a write is in progress
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA wal_autocheckpoint=1000")
+            _configure_connection(conn)
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache_entries (
                     key TEXT PRIMARY KEY,
                     value BLOB,
-                    created_at TIMESTAMP,
-                    expires_at TIMESTAMP,
+                    created_at INTEGER,  -- unix milliseconds
+                    expires_at INTEGER,
                     access_count INTEGER DEFAULT 0,
-                    last_accessed TIMESTAMP,
+                    last_accessed INTEGER,
                     tags TEXT,  -- JSON array of tags
                     size_bytes INTEGER
                 )
             """)
             
+            # Older databases stored local-time ISO strings; integers sort before text,
+            # so those rows would never look expired until converted
+            conn.execute("""
+                UPDATE cache_entries SET
+                    created_at = CAST(ROUND((julianday(created_at, 'utc') - 2440587.5) * 86400000) AS INTEGER),
+                    expires_at = CAST(ROUND((julianday(expires_at, 'utc') - 2440587.5) * 86400000) AS INTEGER),
+                    last_accessed = CAST(ROUND((julianday(last_accessed, 'utc') - 2440587.5) * 86400000) AS INTEGER)
+                WHERE typeof(expires_at) = 'text'
+            """)
+            
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_expires_at ON cache_entries(expires_at)
             """)
             
+            # Tags live in their own table so invalidation is an indexed lookup
+            has_tag_table = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'cache_tags'"
+            ).fetchone() is not None
+            
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_tags ON cache_entries(tags)
+                CREATE TABLE IF NOT EXISTS cache_tags (
+                    key TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (tag, key)
+                ) WITHOUT ROWID
             """)
             
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_cache_tags_key ON cache_tags(key)
+            """)
+            
+            conn.execute("DROP INDEX IF EXISTS idx_tags")
+            
+            if not has_tag_table:
+                # Carry over tags from databases created before cache_tags existed
+                conn.execute("""
+                    INSERT OR IGNORE INTO cache_tags (key, tag)
+                    SELECT cache_entries.key, json_each.value
+                    FROM cache_entries, json_each(cache_entries.tags)
+                    WHERE json_valid(cache_entries.tags)
+                """)
+            
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_last_accessed ON cache_entries(last_accessed)
             """)
             
         logger.info("📦 Cache database initialized")
     
+    def _build_bloom_sync(self) -> _BloomFilter:
+        """Build a Bloom filter of the unexpired keys on disk."""
+        with self._get_db_connection() as conn:
+            keys = [row[0] for row in conn.execute(
+                "SELECT key FROM cache_entries WHERE expires_at > ?", (_now_millis(),)
+            )]
+        
+        bloom = _BloomFilter(2 * len(keys))
+        for key in keys:
+            bloom.add(key)
+        return bloom
+    
+    async def _rebuild_bloom(self):
+        """Replace the Bloom filter, dropping deleted and expired keys."""
+        try:
+            bloom = await self._run_db(self._build_bloom_sync)
+        except Exception as e:
+            logger.error(f"📦 Bloom filter rebuild error: {e}")
+            return
+        
+        # Rows still waiting for the writer aren't on disk yet
+        for key in self._pending_writes:
+            bloom.add(key)
+        self._bloom = bloom
+        logger.debug(f"📦 Rebuilt Bloom filter with {bloom.count} keys")
+    
+    def _schedule_bloom_rebuild(self):
+        """Rebuild the Bloom filter in the background unless a rebuild is already running."""
+        task = self._bloom_rebuild_task
+        if task is None or task.done():
+            self._bloom_rebuild_task = asyncio.get_running_loop().create_task(self._rebuild_bloom())
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's persistent connection, opening it on first use.
+        
+        Connections run in autocommit mode (isolation_level=None); multi-statement
+        writes go through _write_transaction.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            _configure_connection(conn)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+            self._local.cursor = conn.cursor()
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def _cursor(self) -> sqlite3.Cursor:
+        """Return a cursor on this thread's connection, reused across statements."""
+        self._connection()
+        return self._local.cursor
+    
     @contextmanager
     def _get_db_connection(self):
-        """Get database connection with proper cleanup."""
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's database connection for reads and single-statement updates."""
+        yield self._connection()
+    
+    @contextmanager
+    def _write_transaction(self):
+        """Run the block in one BEGIN IMMEDIATE ... COMMIT transaction, rolling back on error.
+        
+        Yields this thread's reusable cursor.
+        """
+        cursor = self._cursor()
+        cursor.execute("BEGIN IMMEDIATE")
         try:
-            yield conn
-        finally:
-            conn.close()
+            yield cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
+    
+    async def _run_db(self, func, *args):
+        """Run blocking database work on the cache's database worker thread."""
+        if self._db_executor is None:
+            self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="research-cache-db")
+        return await asyncio.get_running_loop().run_in_executor(self._db_executor, func, *args)
+    
+    def close(self):
+        """Write any pending entries, then close all persistent database connections."""
+        # Let in-flight database work finish, then write what is still queued; this
+        # must not depend on the event loop, which may already be closed at exit
+        if self._db_executor is not None:
+            self._db_executor.shutdown(wait=True)
+            self._db_executor = None
+        self._flush_pending_writes()
+        
+        for task in (self._writer_task, self._bloom_rebuild_task, self._cleanup_task):
+            # Cancelling a task whose loop is closed raises RuntimeError
+            if task is not None and not task.done() and not task.get_loop().is_closed():
+                task.cancel()
+        self._writer_task = None
+        self._bloom_rebuild_task = None
+        self._cleanup_task = None
+        
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
     
-    def _generate_key(self, *args, **kwargs) -> str:
+    @staticmethod
+    def _generate_key(*args, **kwargs) -> str:
         """Generate cache key from arguments."""
-        key_data = {
-            "args": args,
-            "kwargs": sorted(kwargs.items())
-        }
-        key_string = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_string.encode()).hexdigest()
+        if not kwargs and all(type(arg) in _FAST_KEY_TYPES for arg in args):
+            # Memoize only exact str/int/bytes args: lru_cache treats 1, 1.0 and True as equal
+            return _cached_cache_key(args, ())
+        return _compute_cache_key(args, tuple(sorted(kwargs.items())))
     
     def _serialize_value(self, value: Any) -> bytes:
-        """Serialize value for storage."""
-        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        """Serialize value for storage.
+        
+        Plain JSON-like values (exact dict/list/str/int/float/bool/None/bytes) are
+        stored as msgpack; anything else, including tuples and subclasses, is pickled
+        so it round-trips with its type intact.
+        """
+        if MSGPACK_AVAILABLE:
+            try:
+                return _MSGPACK_MARKER + msgpack.packb(value, use_bin_type=True, strict_types=True)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return _PICKLE_MARKER + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
     
     def _deserialize_value(self, data: bytes) -> Any:
         """Deserialize value from storage."""
+        marker = data[:1]
+        if marker == _ZSTD_MARKER:
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("Cached value is zstd-compressed but zstandard is not installed")
+            data = _zstd_contexts()[1].decompress(data[1:])
+            marker = data[:1]
+        if marker == _MSGPACK_MARKER:
+            return msgpack.unpackb(data[1:], raw=False, strict_map_key=False)
+        if marker == _PICKLE_MARKER:
+            return pickle.loads(data[1:])
         return pickle.loads(data)
     
-    def _calculate_size(self, value: Any) -> int:
-        """Calculate size of value in bytes."""
-        return len(self._serialize_value(value))
-    
-    async def get(self, 
-                  key: Optional[str] = None, 
-                  *args, 
-                  tags: List[str] = None,
-                  **kwargs) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache.
         
         Args:
-            key: Explicit cache key (if not provided, generated from args/kwargs)
-            *args: Arguments to generate key from
-            tags: Tags to filter by
-            **kwargs: Keyword arguments to generate key from
+            key: Cache key
         
         Returns:
             Cached value or None if not found/expired
         """
         
-        if key is None:
-            key = self._generate_key(*args, **kwargs)
-        
         # Check memory cache first
         if key in self.memory_cache:
             entry = self.memory_cache[key]
             if not entry.is_expired():
                 entry.access_count += 1
                 entry.last_accessed = datetime.now()
+                entry.visited = True
                 self.stats["hits"] += 1
                 self.stats["memory_hits"] += 1
                 logger.debug(f"📦 Memory cache hit for key: {key[:16]}...")
@@ -179,36 +548,49 @@ class ResearchDataCache:
                 # Remove expired entry from memory
                 self._remove_from_memory(key)
         
+        # Check entries still waiting for the background writer
+        pending = self._pending_writes.get(key)
+        if pending is not None and pending[3] > _now_millis():
+            self.stats["hits"] += 1
+            self.stats["memory_hits"] += 1
+            logger.debug(f"📦 Pending write hit for key: {key[:16]}...")
+            return self._deserialize_value(pending[1])
+        
+        # Keys that were never stored can't be on disk
+        if key not in self._bloom:
+            self.stats["misses"] += 1
+            logger.debug(f"📦 Cache miss for key: {key[:16]}...")
+            return None
+        
         # Check disk cache
         try:
-            with self._get_db_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT value, created_at, expires_at, access_count, tags, size_bytes
-                    FROM cache_entries 
-                    WHERE key = ? AND expires_at > ?
-                """, (key, datetime.now()))
+            found = await self._run_db(self._get_sync, key)
+            if found:
+                value, row = found
+                
+                # Record the hit in memory; flush() writes accumulated hits in one batch
+                hits, _ = self._pending_hits.get(key, (0, 0))
+                hits += 1
+                self._pending_hits[key] = (hits, _now_millis())
                 
-                row = cursor.fetchone()
+                # Add to memory cache if it's frequently accessed
+                access_count = row["access_count"] + hits
+                if access_count >= 3:  # Add to memory after 3+ accesses
+                    await self._add_to_memory(CacheEntry(
+                        key=key,
+                        value=value,
+                        created_at=_from_millis(row["created_at"]),
+                        expires_at=_from_millis(row["expires_at"]),
+                        access_count=access_count,
+                        last_accessed=datetime.now(),
+                        tags=json.loads(row["tags"]) if row["tags"] else [],
+                        size_bytes=row["size_bytes"]
+                    ))
                 
-                if row:
-                    value = self._deserialize_value(row["value"])
-                    
-                    # Update access stats
-                    conn.execute("""
-                        UPDATE cache_entries 
-                        SET access_count = access_count + 1, last_accessed = ?
-                        WHERE key = ?
-                    """, (datetime.now(), key))
-                    
-                    # Add to memory cache if it's frequently accessed
-                    access_count = row["access_count"] + 1
-                    if access_count >= 3:  # Add to memory after 3+ accesses
-                        await self._add_to_memory(key, value, dict(row))
-                    
-                    self.stats["hits"] += 1
-                    self.stats["disk_hits"] += 1
-                    logger.debug(f"📦 Disk cache hit for key: {key[:16]}...")
-                    return value
+                self.stats["hits"] += 1
+                self.stats["disk_hits"] += 1
+                logger.debug(f"📦 Disk cache hit for key: {key[:16]}...")
+                return value
         
         except Exception as e:
             logger.warning(f"📦 Cache read error for key {key[:16]}...: {e}")
@@ -217,28 +599,34 @@ class ResearchDataCache:
         logger.debug(f"📦 Cache miss for key: {key[:16]}...")
         return None
     
+    def _get_sync(self, key: str) -> Optional[Tuple[Any, sqlite3.Row]]:
+        """Read an unexpired entry from disk."""
+        row = self._cursor().execute(_GET_ENTRY_SQL, (key, _now_millis())).fetchone()
+        if not row:
+            return None
+        
+        value = self._deserialize_value(row["value"])
+        return value, row
+    
+    async def get_by_args(self, *args, **kwargs) -> Optional[Any]:
+        """Get the value cached under the key generated from args/kwargs."""
+        return await self.get(self._generate_key(*args, **kwargs))
+    
     async def set(self, 
                   value: Any,
-                  key: Optional[str] = None,
-                  *args,
+                  key: str,
                   ttl: Optional[timedelta] = None,
-                  tags: List[str] = None,
-                  **kwargs):
+                  tags: List[str] = None):
         """
         Set value in cache.
         
         Args:
             value: Value to cache
-            key: Explicit cache key (if not provided, generated from args/kwargs)
-            *args: Arguments to generate key from
+            key: Cache key
             ttl: Time to live (if not provided, uses default)
             tags: Tags for cache invalidation
-            **kwargs: Keyword arguments to generate key from
         """
         
-        if key is None:
-            key = self._generate_key(*args, **kwargs)
-        
         if ttl is None:
             ttl = self.default_ttl
         
@@ -247,7 +635,10 @@ class ResearchDataCache:
         
         now = datetime.now()
         expires_at = now + ttl
-        size_bytes = self._calculate_size(value)
+        
+        # Serialize once; the blob's length is the entry size
+        serialized_value = self._serialize_value(value)
+        size_bytes = len(serialized_value)
         
         # Create cache entry
         entry = CacheEntry(
@@ -261,121 +652,243 @@ class ResearchDataCache:
             size_bytes=size_bytes
         )
         
-        # Store in database
-        try:
-            serialized_value = self._serialize_value(value)
-            tags_json = json.dumps(tags)
-            
-            with self._get_db_connection() as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO cache_entries 
-                    (key, value, created_at, expires_at, access_count, last_accessed, tags, size_bytes)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (key, serialized_value, now, expires_at, 1, now, tags_json, size_bytes))
-            
-            logger.debug(f"📦 Stored in disk cache: {key[:16]}... ({size_bytes} bytes)")
-            
-        except Exception as e:
-            logger.error(f"📦 Cache write error for key {key[:16]}...: {e}")
-            return
+        # Queue for the background writer, replacing any earlier pending write of this key;
+        # the new row starts its own access count
+        self._pending_hits.pop(key, None)
+        now_ms = _to_millis(now)
+        self._pending_writes[key] = (
+            key, serialized_value, now_ms, _to_millis(expires_at), 1, now_ms, json.dumps(tags), size_bytes
+        )
+        self._ensure_writer()
+        self._ensure_cleanup_task()
+        self._write_wakeup.set()
+        logger.debug(f"📦 Queued for disk cache: {key[:16]}... ({size_bytes} bytes)")
+        
+        self._bloom.add(key)
+        if self._bloom.is_full():
+            self._schedule_bloom_rebuild()
         
         # Add to memory cache if small enough
         if size_bytes <= self.max_memory_size // 10:  # Max 10% of memory per item
-            await self._add_to_memory(key, value, asdict(entry))
-        
-        # Periodic cleanup
-        if len(self.memory_cache) % 100 == 0:  # Every 100 operations
+            await self._add_to_memory(entry)
+    
+    def _ensure_writer(self):
+        """Start the background writer on the running event loop if it is not already running there."""
+        loop = asyncio.get_running_loop()
+        task = self._writer_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._write_wakeup = asyncio.Event()
+            self._writer_task = loop.create_task(self._writer_loop())
+    
+    def _ensure_cleanup_task(self):
+        """Start the periodic cleanup on the running event loop if it is not already running there."""
+        loop = asyncio.get_running_loop()
+        task = self._cleanup_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._cleanup_task = loop.create_task(self._cleanup_periodic())
+    
+    async def _cleanup_periodic(self):
+        """Remove expired entries every _CLEANUP_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(_CLEANUP_INTERVAL)
+            await self.flush()
             await self._cleanup_expired()
     
-    async def _add_to_memory(self, key: str, value: Any, entry_data: Dict[str, Any]):
+    async def _writer_loop(self):
+        """Write queued entries in batches, one transaction per batch."""
+        while True:
+            await self._write_wakeup.wait()
+            await asyncio.sleep(_WRITE_BATCH_DELAY)
+            self._write_wakeup.clear()
+            await self.flush()
+    
+    def _write_rows_sync(self, batch: List[Tuple]):
+        """Insert or replace a batch of entry rows, and their tags, in one transaction."""
+        rows = [self._compress_row(row) for row in batch]
+        placeholders = ",".join(["?"] * len(rows))
+        with self._write_transaction() as cursor:
+            # Rows about to be replaced no longer count towards the disk totals
+            replaced = cursor.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_entries WHERE key IN ({placeholders})",
+                [row[0] for row in rows]
+            ).fetchone()
+            cursor.executemany(_INSERT_ENTRY_SQL, rows)
+            cursor.executemany(_DELETE_TAGS_SQL, [(row[0],) for row in batch])
+            cursor.executemany(
+                _INSERT_TAG_SQL,
+                [(row[0], tag) for row in batch for tag in json.loads(row[6])]
+            )
+        self._disk_entries += len(rows) - replaced[0]
+        self._disk_size += sum(row[7] for row in rows) - replaced[1]
+        logger.debug(f"📦 Stored {len(batch)} entries in disk cache")
+    
+    def _compress_row(self, row: Tuple) -> Tuple:
+        """Compress a pending row's value blob for disk, recording the stored size."""
+        blob = row[1]
+        if not ZSTD_AVAILABLE or len(blob) <= _COMPRESS_MIN_SIZE:
+            return row
+        compressed = _ZSTD_MARKER + _zstd_contexts()[0].compress(blob)
+        return row[:1] + (compressed,) + row[2:7] + (len(compressed),)
+    
+    def _write_hits_sync(self, hits: Dict[str, Tuple[int, int]]):
+        """Add accumulated disk hits to access_count/last_accessed in one transaction."""
+        with self._write_transaction() as cursor:
+            cursor.executemany(
+                _RECORD_HITS_SQL,
+                [(count, last_hit, key) for key, (count, last_hit) in hits.items()]
+            )
+    
+    def _drop_written(self, batch: List[Tuple]):
+        """Drop written rows from pending writes, unless set() replaced them meanwhile."""
+        for row in batch:
+            if self._pending_writes.get(row[0]) is row:
+                del self._pending_writes[row[0]]
+    
+    async def flush(self):
+        """Write all pending entries and access counts to disk now."""
+        while self._pending_writes:
+            batch = list(islice(self._pending_writes.values(), _WRITE_BATCH_SIZE))
+            try:
+                await self._run_db(self._write_rows_sync, batch)
+            except Exception as e:
+                logger.error(f"📦 Cache write error for {len(batch)} entries: {e}")
+            finally:
+                self._drop_written(batch)
+        
+        if self._pending_hits:
+            hits, self._pending_hits = self._pending_hits, {}
+            try:
+                await self._run_db(self._write_hits_sync, hits)
+            except Exception as e:
+                logger.error(f"📦 Cache access count update error for {len(hits)} entries: {e}")
+    
+    def _flush_pending_writes(self):
+        """Synchronous flush() for shutdown, run on the calling thread."""
+        while self._pending_writes:
+            batch = list(islice(self._pending_writes.values(), _WRITE_BATCH_SIZE))
+            try:
+                self._write_rows_sync(batch)
+            except Exception as e:
+                logger.error(f"📦 Cache write error for {len(batch)} entries: {e}")
+            finally:
+                self._drop_written(batch)
+        
+        if self._pending_hits:
+            hits, self._pending_hits = self._pending_hits, {}
+            try:
+                self._write_hits_sync(hits)
+            except Exception as e:
+                logger.error(f"📦 Cache access count update error for {len(hits)} entries: {e}")
+    
+    async def _add_to_memory(self, entry: CacheEntry):
         """Add entry to memory cache with eviction if needed."""
         
-        size_bytes = entry_data.get("size_bytes", self._calculate_size(value))
+        key = entry.key
+        size_bytes = entry.size_bytes
+        
+        # Replacing an entry must release its old size first
+        self._remove_from_memory(key)
         
         # Check if we need to evict
         while (self.memory_size + size_bytes > self.max_memory_size and 
                len(self.memory_cache) > 0):
             await self._evict_from_memory()
         
-        # Create memory entry
-        entry = CacheEntry(
-            key=key,
-            value=value,
-            created_at=entry_data.get("created_at", datetime.now()),
-            expires_at=entry_data.get("expires_at", datetime.now() + self.default_ttl),
-            access_count=entry_data.get("access_count", 1),
-            last_accessed=entry_data.get("last_accessed", datetime.now()),
-            tags=entry_data.get("tags", []),
-            size_bytes=size_bytes
-        )
-        
         self.memory_cache[key] = entry
+        self._sieve_ahead[key] = None
         self.memory_size += size_bytes
         
         logger.debug(f"📦 Added to memory cache: {key[:16]}... ({size_bytes} bytes)")
     
     async def _evict_from_memory(self):
-        """Evict least recently used item from memory cache."""
+        """Evict one item from memory cache using SIEVE.
         
-        if not self.memory_cache:
-            return
-        
-        # Find LRU item
-        lru_key = min(self.memory_cache.keys(), 
-                     key=lambda k: self.memory_cache[k].last_accessed)
+        The hand moves from older to newer entries, clearing the visited bit of
+        entries hit since its last pass and evicting the first one that wasn't;
+        survivors keep their place in the queue. At the newest entry it wraps around.
+        """
         
-        self._remove_from_memory(lru_key)
-        self.stats["evictions"] += 1
+        while self.memory_cache:
+            if not self._sieve_ahead:
+                self._sieve_ahead, self._sieve_swept = self._sieve_swept, OrderedDict()
+            key, _ = self._sieve_ahead.popitem(last=False)
+            entry = self.memory_cache.get(key)
+            if entry is None:
+                continue
+            if entry.visited:
+                entry.visited = False
+                self._sieve_swept[key] = None
+                continue
+            
+            del self.memory_cache[key]
+            self.memory_size -= entry.size_bytes
+            self.stats["evictions"] += 1
+            logger.debug(f"📦 Evicted from memory cache: {key[:16]}...")
+            return
     
     def _remove_from_memory(self, key: str):
         """Remove item from memory cache."""
         if key in self.memory_cache:
-            entry = self.memory_cache[key]
+            entry = self.memory_cache.pop(key)
             self.memory_size -= entry.size_bytes
-            del self.memory_cache[key]
+            if key in self._sieve_ahead:
+                del self._sieve_ahead[key]
+            else:
+                self._sieve_swept.pop(key, None)
             logger.debug(f"📦 Removed from memory cache: {key[:16]}...")
     
-    async def delete(self, key: Optional[str] = None, *args, **kwargs):
+    async def set_by_args(self,
+                          value: Any,
+                          *args,
+                          ttl: Optional[timedelta] = None,
+                          tags: List[str] = None,
+                          **kwargs):
+        """Set value in cache under the key generated from args/kwargs."""
+        await self.set(value, self._generate_key(*args, **kwargs), ttl=ttl, tags=tags)
+    
+    async def delete(self, key: str):
         """Delete entry from cache."""
         
-        if key is None:
-            key = self._generate_key(*args, **kwargs)
-        
-        # Remove from memory
+        # Remove from memory and from pending writes
         self._remove_from_memory(key)
+        self._pending_writes.pop(key, None)
         
         # Remove from disk
         try:
-            with self._get_db_connection() as conn:
-                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            await self._run_db(self._delete_sync, key)
             logger.debug(f"📦 Deleted from cache: {key[:16]}...")
         except Exception as e:
             logger.error(f"📦 Cache delete error for key {key[:16]}...: {e}")
     
+    async def delete_by_args(self, *args, **kwargs):
+        """Delete the entry cached under the key generated from args/kwargs."""
+        await self.delete(self._generate_key(*args, **kwargs))
+    
+    def _delete_sync(self, key: str):
+        """Delete one disk entry."""
+        with self._write_transaction() as cursor:
+            row = cursor.execute("SELECT size_bytes FROM cache_entries WHERE key = ?", (key,)).fetchone()
+            cursor.execute(_DELETE_ENTRY_SQL, (key,))
+            cursor.execute(_DELETE_TAGS_SQL, (key,))
+        if row is not None:
+            self._disk_entries -= 1
+            self._disk_size -= row[0] or 0
+    
     async def delete_by_tags(self, tags: List[str]):
         """Delete all entries with any of the specified tags."""
         
         if not tags:
             return
         
-        deleted_keys = []
+        deleted_keys = [
+            key for key, row in self._pending_writes.items()
+            if any(tag in json.loads(row[6]) for tag in tags)
+        ]
+        for key in deleted_keys:
+            del self._pending_writes[key]
         
         try:
-            with self._get_db_connection() as conn:
-                # Find entries with matching tags
-                cursor = conn.execute("""
-                    SELECT key, tags FROM cache_entries
-                """)
-                
-                for row in cursor:
-                    entry_tags = json.loads(row["tags"] or "[]")
-                    if any(tag in entry_tags for tag in tags):
-                        deleted_keys.append(row["key"])
-                
-                # Delete matching entries
-                if deleted_keys:
-                    placeholders = ",".join(["?"] * len(deleted_keys))
-                    conn.execute(f"DELETE FROM cache_entries WHERE key IN ({placeholders})", deleted_keys)
+            deleted_keys.extend(await self._run_db(self._delete_by_tags_sync, tags))
         
         except Exception as e:
             logger.error(f"📦 Cache delete by tags error: {e}")
@@ -387,6 +900,22 @@ class ResearchDataCache:
         
         logger.info(f"📦 Deleted {len(deleted_keys)} entries by tags: {tags}")
     
+    def _delete_by_tags_sync(self, tags: List[str]) -> List[str]:
+        """Delete disk entries with any of the tags and return their keys."""
+        placeholders = ",".join(["?"] * len(tags))
+        tagged_keys = f"SELECT key FROM cache_tags WHERE tag IN ({placeholders})"
+        
+        with self._write_transaction() as cursor:
+            deleted = cursor.execute(
+                f"SELECT key, size_bytes FROM cache_entries WHERE key IN ({tagged_keys})", tags
+            ).fetchall()
+            if deleted:
+                cursor.execute(f"DELETE FROM cache_entries WHERE key IN ({tagged_keys})", tags)
+            cursor.execute(f"DELETE FROM cache_tags WHERE key IN ({tagged_keys})", tags)
+        self._disk_entries -= len(deleted)
+        self._disk_size -= sum(row["size_bytes"] or 0 for row in deleted)
+        return [row["key"] for row in deleted]
+    
     async def _cleanup_expired(self):
         """Remove expired entries from cache."""
         
@@ -401,51 +930,64 @@ class ResearchDataCache:
         
         # Clean disk cache
         try:
-            with self._get_db_connection() as conn:
-                result = conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
-                deleted_count = result.rowcount
-                
+            deleted_count = await self._run_db(self._cleanup_sync, _to_millis(now))
+            
             if deleted_count > 0 or expired_keys:
                 self.stats["cleanups"] += 1
                 logger.info(f"📦 Cleaned up {deleted_count} expired disk entries and {len(expired_keys)} memory entries")
+            
+            if deleted_count > 0:
+                self._schedule_bloom_rebuild()
         
         except Exception as e:
             logger.error(f"📦 Cache cleanup error: {e}")
     
+    def _cleanup_sync(self, now_ms: int) -> int:
+        """Delete disk entries expired as of now_ms and return how many were removed."""
+        with self._write_transaction() as cursor:
+            expired_count, expired_size = cursor.execute(_EXPIRED_TOTALS_SQL, (now_ms,)).fetchone()
+            cursor.execute(_DELETE_EXPIRED_TAGS_SQL, (now_ms,))
+            cursor.execute(_DELETE_EXPIRED_ENTRIES_SQL, (now_ms,))
+        self._disk_entries -= expired_count
+        self._disk_size -= expired_size
+        return expired_count
+    
     async def clear_all(self):
         """Clear all cache data."""
         
-        # Clear memory
+        # Clear memory and pending writes
         self.memory_cache.clear()
+        self._sieve_swept.clear()
+        self._sieve_ahead.clear()
         self.memory_size = 0
+        self._pending_writes.clear()
+        self._pending_hits.clear()
         
         # Clear disk
         try:
-            with self._get_db_connection() as conn:
-                conn.execute("DELETE FROM cache_entries")
+            await self._run_db(self._clear_sync)
+            self._bloom = _BloomFilter()
+            for key in self._pending_writes:
+                self._bloom.add(key)
             logger.info("📦 Cleared all cache data")
         except Exception as e:
             logger.error(f"📦 Cache clear error: {e}")
     
+    def _clear_sync(self):
+        """Delete every disk entry."""
+        with self._write_transaction() as cursor:
+            cursor.execute("DELETE FROM cache_entries")
+            cursor.execute("DELETE FROM cache_tags")
+        self._disk_entries = 0
+        self._disk_size = 0
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         
         hit_rate = (self.stats["hits"] / (self.stats["hits"] + self.stats["misses"]) 
                    if (self.stats["hits"] + self.stats["misses"]) > 0 else 0.0)
         
-        # Get disk cache stats
-        disk_entries = 0
-        disk_size = 0
-        
-        try:
-            with self._get_db_connection() as conn:
-                cursor = conn.execute("SELECT COUNT(*), SUM(size_bytes) FROM cache_entries")
-                row = cursor.fetchone()
-                if row:
-                    disk_entries = row[0] or 0
-                    disk_size = row[1] or 0
-        except Exception as e:
-            logger.error(f"📦 Stats query error: {e}")
+        disk_size = self._disk_size
         
         return {
             "hits": self.stats["hits"],
@@ -458,27 +1000,34 @@ class ResearchDataCache:
             "memory_entries": len(self.memory_cache),
             "memory_size_mb": self.memory_size / (1024 * 1024),
             "memory_utilization": self.memory_size / self.max_memory_size,
-            "disk_entries": disk_entries,
+            "pending_writes": len(self._pending_writes),
+            "disk_entries": self._disk_entries,
             "disk_size_mb": disk_size / (1024 * 1024),
             "disk_utilization": disk_size / self.max_disk_size if self.max_disk_size > 0 else 0.0
         }
     
-    async def fund_research_key(self, ticker: str, research_type: str = "comprehensive") -> str:
+    @staticmethod
+    def fund_research_key(ticker: str, research_type: str = "comprehensive") -> str:
         """Generate cache key for fund research data."""
-        return self._generate_key("fund_research", ticker.upper(), research_type)
+        return ResearchDataCache._generate_key("fund_research", ticker.upper(), research_type)
     
-    async def classification_key(self, ticker: str, research_hash: Optional[str] = None) -> str:
+    @staticmethod
+    def classification_key(ticker: str, research_hash: Optional[str] = None) -> str:
         """Generate cache key for fund classification data."""
-        return self._generate_key("fund_classification", ticker.upper(), research_hash or "")
+        return ResearchDataCache._generate_key("fund_classification", ticker.upper(), research_hash or "")
     
-    async def web_search_key(self, query: str, search_type: str = "general") -> str:
+    @staticmethod
+    def web_search_key(query: str, search_type: str = "general") -> str:
         """Generate cache key for web search results."""
-        return self._generate_key("web_search", query, search_type)
+        return ResearchDataCache._generate_key("web_search", query, search_type)
 
 
 # Global cache instance
 research_cache = ResearchDataCache()
 
+# Write queued entries and debounced access counts before the process exits
+atexit.register(research_cache.close)
+
 
 class CacheableResearchMixin:
     """Mixin class to add caching capabilities to research agents."""
@@ -486,16 +1035,44 @@ class CacheableResearchMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.cache = research_cache
+        
+        # Results this agent already fetched or computed: key -> (result, monotonic expiry)
+        self._local_results: OrderedDict[Tuple, Tuple[Any, float]] = OrderedDict()
+    
+    def _get_local_result(self, local_key: Tuple) -> Optional[Any]:
+        """Return an unexpired in-process result, if any."""
+        found = self._local_results.get(local_key)
+        if found is None:
+            return None
+        result, expires = found
+        if time.monotonic() >= expires:
+            del self._local_results[local_key]
+            return None
+        return result
+    
+    def _set_local_result(self, local_key: Tuple, result: Any, ttl: timedelta):
+        """Remember a result in-process, dropping the oldest beyond _LOCAL_RESULTS_SIZE."""
+        self._local_results.pop(local_key, None)
+        self._local_results[local_key] = (result, time.monotonic() + ttl.total_seconds())
+        if len(self._local_results) > _LOCAL_RESULTS_SIZE:
+            self._local_results.popitem(last=False)
     
     async def cached_fund_research(self, ticker: str, research_function, *args, **kwargs):
         """Execute fund research with caching."""
         
-        cache_key = await self.cache.fund_research_key(ticker)
+        local_key = ("research", ticker)
+        cached_result = self._get_local_result(local_key)
+        if cached_result is not None:
+            return cached_result
+        
+        cache_key = self.cache.fund_research_key(ticker)
+        ttl = timedelta(hours=24)
         
         # Try to get from cache
-        cached_result = await self.cache.get(cache_key, tags=[f"fund:{ticker}", "research"])
+        cached_result = await self.cache.get(cache_key)
         if cached_result:
             logger.info(f"📦 Using cached research for {ticker}")
+            self._set_local_result(local_key, cached_result, ttl)
             return cached_result
         
         # Execute research function
@@ -506,9 +1083,10 @@ class CacheableResearchMixin:
         await self.cache.set(
             result,
             key=cache_key,
-            ttl=timedelta(hours=24),
+            ttl=ttl,
             tags=[f"fund:{ticker}", "research"]
         )
+        self._set_local_result(local_key, result, ttl)
         
         return result
     
@@ -516,13 +1094,25 @@ class CacheableResearchMixin:
         """Execute fund classification with caching."""
         
         # Generate hash of research data for cache key
-        research_hash = hashlib.md5(str(research_data).encode()).hexdigest()[:8]
-        cache_key = await self.cache.classification_key(ticker, research_hash)
+        blob = self.cache._serialize_value(research_data)
+        if XXHASH_AVAILABLE:
+            research_hash = xxhash.xxh64(blob).hexdigest()
+        else:
+            research_hash = hashlib.blake2b(blob, digest_size=8).hexdigest()
+        
+        local_key = ("classification", ticker, research_hash)
+        cached_result = self._get_local_result(local_key)
+        if cached_result is not None:
+            return cached_result
+        
+        cache_key = self.cache.classification_key(ticker, research_hash)
+        ttl = timedelta(hours=12)  # Classifications may change more often
         
         # Try to get from cache
-        cached_result = await self.cache.get(cache_key, tags=[f"fund:{ticker}", "classification"])
+        cached_result = await self.cache.get(cache_key)
         if cached_result:
             logger.info(f"📦 Using cached classification for {ticker}")
+            self._set_local_result(local_key, cached_result, ttl)
             return cached_result
         
         # Execute classification function
@@ -533,19 +1123,24 @@ class CacheableResearchMixin:
         await self.cache.set(
             result,
             key=cache_key,
-            ttl=timedelta(hours=12),  # Classifications may change more often
+            ttl=ttl,
             tags=[f"fund:{ticker}", "classification"]
         )
+        self._set_local_result(local_key, result, ttl)
         
         return result
     
     async def invalidate_fund_cache(self, ticker: str):
         """Invalidate all cached data for a specific fund."""
+        for local_key in [k for k in self._local_results if k[1] == ticker]:
+            del self._local_results[local_key]
         await self.cache.delete_by_tags([f"fund:{ticker}"])
         logger.info(f"📦 Invalidated cache for fund {ticker}")
     
     async def invalidate_research_cache(self):
         """Invalidate all research cache data."""
+        for local_key in [k for k in self._local_results if k[0] == "research"]:
+            del self._local_results[local_key]
         await self.cache.delete_by_tags(["research"])
         logger.info(f"📦 Invalidated all research cache data")
 
@@ -559,7 +1154,7 @@ def cache_result(ttl_hours: int = 24, tags: List[str] = None):
             cache_key = research_cache._generate_key(func.__name__, *args, **kwargs)
             
             # Try cache first
-            cached = await research_cache.get(cache_key, tags=tags or [])
+            cached = await research_cache.get(cache_key)
             if cached is not None:
                 return cached
             
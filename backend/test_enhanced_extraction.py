@@ -4,12 +4,25 @@ Test script for the enhanced extraction pipeline with AI-powered classification
 Tests the complete flow: Document Classification → Routing → Extraction
 """
 
+import argparse
 import asyncio
+import hashlib
+import mmap
 import os
+import pickle
+import statistics
 import sys
 import time
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -19,15 +32,52 @@ from gemini_multi_fund_extractor import GeminiMultiFundExtractor, check_dependen
 from extraction_service import FundExtractionService
 from config import config
 
+# Files classified/extracted at once; each call is I/O-bound on the Gemini API
+MAX_CONCURRENT_FILES = 5
+
+# Classification/extraction results from earlier runs, keyed by file content hash
+RESULT_CACHE_DIR = Path.home() / ".cache" / "fundonboarding"
+
+# Bump when classification/extraction output changes so stale cached results are ignored
+PIPELINE_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _content_hash(file_path: str, mtime_ns: int, size: int) -> str:
+    """Hash a file's content; mtime and size are part of the key so edits rehash."""
+    if size == 0:
+        return hashlib.blake2b().hexdigest()  # mmap can't map an empty file
+    # Hash straight from the page cache rather than copying the PDF into memory
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return hashlib.blake2b(mm).hexdigest()
+
+
+def content_hash(file_path: str) -> str:
+    """Content hash of a file, computed once per process for an unchanged file."""
+    stat = os.stat(file_path)
+    return _content_hash(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+def existing_test_files(test_files: List[str]) -> List[str]:
+    """Deduplicate test files and keep those that exist, warning about the rest."""
+    existing = []
+    for file_path in dict.fromkeys(test_files):
+        if Path(file_path).is_file():
+            existing.append(file_path)
+        else:
+            print(f"⚠️ Test file not found: {file_path}")
+    return existing
+
 
 class ExtractionPipelineTester:
     """Test suite for the enhanced extraction pipeline."""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.test_results = {}
         self.classifier = None
         self.multi_extractor = None
         self.service = None
+        self.use_cache = use_cache
     
     def check_dependencies(self) -> Dict[str, Any]:
         """Check all dependencies for the extraction pipeline."""
@@ -56,22 +106,24 @@ class ExtractionPipelineTester:
         
         return dependencies
     
-    def initialize_components(self) -> bool:
+    async def initialize_components(self) -> bool:
         """Initialize all extraction components."""
         try:
             print("\n🚀 Initializing Components")
             print("=" * 50)
             
-            # Initialize document classifier
-            self.classifier = DocumentClassifier()
-            print("✓ Document classifier initialized")
+            # One Gemini client (and connection pool) shared by every component
+            from google import genai
+            client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
             
-            # Initialize multi-fund extractor
-            self.multi_extractor = GeminiMultiFundExtractor()
+            # Constructors load models; build all three in parallel threads
+            self.classifier, self.multi_extractor, self.service = await asyncio.gather(
+                asyncio.to_thread(DocumentClassifier, client=client),
+                asyncio.to_thread(GeminiMultiFundExtractor, client=client),
+                asyncio.to_thread(FundExtractionService, client=client),
+            )
+            print("✓ Document classifier initialized")
             print("✓ Multi-fund extractor initialized")
-            
-            # Initialize extraction service
-            self.service = FundExtractionService()
             print("✓ Extraction service initialized")
             
             return True
@@ -80,68 +132,135 @@ class ExtractionPipelineTester:
             print(f"❌ Component initialization failed: {e}")
             return False
     
-    async def test_document_classification(self, test_files: List[str]) -> Dict[str, Any]:
-        """Test document classification on sample files."""
+    def _cache_path(self, kind: str, file_path: str) -> Path:
+        return RESULT_CACHE_DIR / f"{content_hash(file_path)}-v{PIPELINE_VERSION}.{kind}.pickle"
+    
+    def _load_cached(self, kind: str, file_path: str) -> Optional[Any]:
+        """Return a cached result for this file's content, if any."""
+        if not self.use_cache:
+            return None
+        try:
+            with open(self._cache_path(kind, file_path), "rb") as f:
+                result = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+            return None
+        print(f"📦 Using cached {kind} result for {Path(file_path).name}")
+        return result
+    
+    def _store_cached(self, kind: str, file_path: str, result: Any):
+        """Cache a result under this file's content hash."""
+        if not self.use_cache:
+            return
+        try:
+            RESULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path(kind, file_path), "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"⚠️ Could not cache {kind} result for {Path(file_path).name}: {e}")
+    
+    async def _classify(self, file_path: str):
+        """Classify a file, reusing a cached result for identical content."""
+        result = self._load_cached("classification", file_path)
+        if result is None:
+            result = await self.classifier.classify_document(file_path)
+            # Filename-based fallbacks after an API error aren't worth keeping
+            if "AI error:" not in result.reasoning:
+                self._store_cached("classification", file_path, result)
+        return result
+    
+    async def _extract(self, file_path: str):
+        """Extract a file, reusing a cached successful result for identical content."""
+        result = self._load_cached("extraction", file_path)
+        if result is None:
+            result = await self.service.extract_fund(file_path, method='auto')
+            if result.success:
+                self._store_cached("extraction", file_path, result)
+        return result
+    
+    def _record_classification(self, results: Dict[str, Any], file_path: str, result, classification_time: float):
+        """Store and print one file's classification result."""
+        filename = Path(file_path).name
+        results[filename] = {
+            "document_type": result.document_type.value,
+            "confidence": result.confidence,
+            "reasoning": result.reasoning,
+            "fund_count_estimate": result.fund_count_estimate,
+            "fund_names": result.fund_names,
+            "classification_time": classification_time
+        }
+        
+        print(f"📄 {filename}:")
+        print(f"   Type: {result.document_type.value}")
+        print(f"   Confidence: {result.confidence:.2f}")
+        print(f"   Time: {classification_time:.2f}s")
+        print(f"   Reasoning: {result.reasoning}")
+        
+        if result.fund_names:
+            print(f"   Funds found: {', '.join(result.fund_names[:3])}{'...' if len(result.fund_names) > 3 else ''}")
+    
+    async def test_document_classification(self, test_files: List[str], batch: bool = False) -> Dict[str, Any]:
+        """Test document classification on sample files.
+        
+        test_files must already be filtered with existing_test_files().
+        With batch=True all files go to Gemini as one Batch API job; if the job
+        fails, classification falls back to per-file calls.
+        """
         print("\n📋 Testing Document Classification")
         print("=" * 50)
         
         results = {}
         
-        for file_path in test_files:
-            if not Path(file_path).exists():
-                print(f"⚠️ Test file not found: {file_path}")
-                continue
-                
+        if batch and test_files:
             try:
-                start_time = time.time()
-                result = await self.classifier.classify_document(file_path)
-                classification_time = time.time() - start_time
-                
-                filename = Path(file_path).name
-                results[filename] = {
-                    "document_type": result.document_type.value,
-                    "confidence": result.confidence,
-                    "reasoning": result.reasoning,
-                    "fund_count_estimate": result.fund_count_estimate,
-                    "fund_names": result.fund_names,
-                    "classification_time": classification_time
-                }
-                
-                print(f"📄 {filename}:")
-                print(f"   Type: {result.document_type.value}")
-                print(f"   Confidence: {result.confidence:.2f}")
-                print(f"   Time: {classification_time:.2f}s")
-                print(f"   Reasoning: {result.reasoning}")
+                print(f"📦 Submitting batch classification job for {len(test_files)} files...")
+                batch_results = await self.classifier.classify_documents_batch(test_files)
+                for file_path, result in zip(test_files, batch_results):
+                    self._record_classification(results, file_path, result, result.classification_time)
+                return results
+            except Exception as e:
+                print(f"⚠️ Batch classification failed, classifying per file: {e}")
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILES)
+        
+        async def classify_one(file_path: str):
+            try:
+                async with semaphore:
+                    start_ns = time.perf_counter_ns()
+                    result = await self._classify(file_path)
+                    classification_time = (time.perf_counter_ns() - start_ns) / 1e9
                 
-                if result.fund_names:
-                    print(f"   Funds found: {', '.join(result.fund_names[:3])}{'...' if len(result.fund_names) > 3 else ''}")
+                self._record_classification(results, file_path, result, classification_time)
                 
             except Exception as e:
                 print(f"❌ Classification failed for {file_path}: {e}")
                 results[Path(file_path).name] = {"error": str(e)}
         
+        # Classify concurrently; each file's output is printed as it completes
+        await asyncio.gather(*[classify_one(f) for f in test_files])
+        
         return results
     
     async def test_extraction_service(self, test_files: List[str]) -> Dict[str, Any]:
-        """Test the unified extraction service."""
+        """Test the unified extraction service.
+        
+        test_files must already be filtered with existing_test_files().
+        """
         print("\n🔧 Testing Unified Extraction Service")
         print("=" * 50)
         
         results = {}
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILES)
         
-        for file_path in test_files:
-            if not Path(file_path).exists():
-                print(f"⚠️ Test file not found: {file_path}")
-                continue
-                
+        async def extract_one(file_path: str):
             try:
                 filename = Path(file_path).name
-                print(f"\n📄 Processing {filename}...")
                 
-                start_time = time.time()
-                result = await self.service.extract_fund(file_path, method='auto')
-                extraction_time = time.time() - start_time
+                async with semaphore:
+                    start_ns = time.perf_counter_ns()
+                    result = await self._extract(file_path)
+                    extraction_time = (time.perf_counter_ns() - start_ns) / 1e9
                 
+                print(f"\n📄 Processed {filename}")
                 results[filename] = {
                     "success": result.success,
                     "method_used": result.method_used,
@@ -182,6 +301,9 @@ class ExtractionPipelineTester:
                 print(f"❌ Extraction failed for {file_path}: {e}")
                 results[Path(file_path).name] = {"error": str(e)}
         
+        # Extract concurrently; each file's output is printed as it completes
+        await asyncio.gather(*[extract_one(f) for f in test_files])
+        
         return results
     
     def generate_test_report(self, classification_results: Dict, extraction_results: Dict):
@@ -189,10 +311,18 @@ class ExtractionPipelineTester:
         print("\n📊 Test Report")
         print("=" * 50)
         
-        # Classification summary
+        # Classification summary, in one pass over the results
         total_classifications = len(classification_results)
-        successful_classifications = sum(1 for r in classification_results.values() if "error" not in r)
-        avg_classification_time = sum(r.get("classification_time", 0) for r in classification_results.values() if "error" not in r) / max(successful_classifications, 1)
+        classification_times = []
+        doc_types = Counter()
+        for result in classification_results.values():
+            if "error" in result:
+                continue
+            classification_times.append(result.get("classification_time", 0))
+            if "document_type" in result:
+                doc_types[result["document_type"]] += 1
+        successful_classifications = len(classification_times)
+        avg_classification_time = statistics.fmean(classification_times) if classification_times else 0.0
         
         print(f"📋 Classification Results:")
         print(f"   Total files: {total_classifications}")
@@ -201,22 +331,25 @@ class ExtractionPipelineTester:
         print(f"   Average time: {avg_classification_time:.2f}s")
         
         # Document type distribution
-        doc_types = {}
-        for result in classification_results.values():
-            if "document_type" in result:
-                doc_type = result["document_type"]
-                doc_types[doc_type] = doc_types.get(doc_type, 0) + 1
-        
         if doc_types:
             print(f"   Document types:")
             for doc_type, count in doc_types.items():
                 print(f"     {doc_type}: {count}")
         
-        # Extraction summary
+        # Extraction summary, in one pass over the results
         total_extractions = len(extraction_results)
-        successful_extractions = sum(1 for r in extraction_results.values() if r.get("success", False))
-        avg_extraction_time = sum(r.get("extraction_time", 0) for r in extraction_results.values() if r.get("success", False)) / max(successful_extractions, 1)
-        total_funds = sum(r.get("total_funds_extracted", 0) for r in extraction_results.values() if r.get("success", False))
+        extraction_times = []
+        total_funds = 0
+        methods = Counter()
+        for result in extraction_results.values():
+            if "method_used" in result:
+                methods[result["method_used"]] += 1
+            if not result.get("success", False):
+                continue
+            extraction_times.append(result.get("extraction_time", 0))
+            total_funds += result.get("total_funds_extracted", 0)
+        successful_extractions = len(extraction_times)
+        avg_extraction_time = statistics.fmean(extraction_times) if extraction_times else 0.0
         
         print(f"\n🔧 Extraction Results:")
         print(f"   Total files: {total_extractions}")
@@ -226,12 +359,6 @@ class ExtractionPipelineTester:
         print(f"   Total funds extracted: {total_funds}")
         
         # Method distribution
-        methods = {}
-        for result in extraction_results.values():
-            if "method_used" in result:
-                method = result["method_used"]
-                methods[method] = methods.get(method, 0) + 1
-        
         if methods:
             print(f"   Methods used:")
             for method, count in methods.items():
@@ -249,7 +376,7 @@ class ExtractionPipelineTester:
         else:
             print("❌ Performance: Needs improvement")
     
-    async def run_full_test_suite(self, test_files: List[str]):
+    async def run_full_test_suite(self, test_files: List[str], batch: bool = False):
         """Run the complete test suite."""
         print("🧪 Enhanced Extraction Pipeline Test Suite")
         print("=" * 70)
@@ -261,14 +388,14 @@ class ExtractionPipelineTester:
             return
         
         # Initialize components
-        if not self.initialize_components():
+        if not await self.initialize_components():
             print("❌ Cannot run tests due to component initialization failure")
             return
         
         # Run tests
         try:
             # Test classification
-            classification_results = await self.test_document_classification(test_files)
+            classification_results = await self.test_document_classification(test_files, batch=batch)
             
             # Test extraction
             extraction_results = await self.test_extraction_service(test_files)
@@ -286,6 +413,19 @@ class ExtractionPipelineTester:
 
 async def main():
     """Main test function."""
+    parser = argparse.ArgumentParser(description="Test the enhanced extraction pipeline")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Classify all files in one Gemini Batch API job (cheaper, but slower to complete)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore and don't write cached results in {RESULT_CACHE_DIR}"
+    )
+    args = parser.parse_args()
+    
     # Define test files (add paths to actual test PDFs)
     test_files = [
         "/home/ec2-user/fundonboarding/data/VTI.pdf",
@@ -294,8 +434,8 @@ async def main():
         "/home/ec2-user/fundonboarding/data/fidelity_fund.pdf"
     ]
     
-    # Filter to only existing files
-    existing_files = [f for f in test_files if Path(f).exists()]
+    # Filter to only existing files, once for both test phases
+    existing_files = existing_test_files(test_files)
     
     if not existing_files:
         print("❌ No test files found. Please add some PDF files to test with.")
@@ -307,9 +447,12 @@ async def main():
     print(f"📁 Found {len(existing_files)} test files")
     
     # Run test suite
-    tester = ExtractionPipelineTester()
-    await tester.run_full_test_suite(existing_files)
+    tester = ExtractionPipelineTester(use_cache=not args.no_cache)
+    await tester.run_full_test_suite(existing_files, batch=args.batch)
 
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        # libuv-based loop: less per-callback overhead with many Gemini calls in flight
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
@@ -2,12 +2,22 @@
 """Test the web UI with mock fund data."""
 
 import json
+import sys
 import asyncio
+import numpy as np
 from fastapi.testclient import TestClient
 from main import app
+from analytics_kernels import summarize_funds
 
-# Mock fund data that resembles real Fidelity fund extraction results
-MOCK_FUND_DATA = [
+try:
+    import orjson
+    _json_dumps_bytes = orjson.dumps
+except ImportError:
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Mock fund records that resemble real Fidelity fund extraction results
+_MOCK_FUND_RECORDS = [
     {
         "fund_name": "Fidelity Blue Chip Growth Fund",
         "target_equity_pct": 85.0,
@@ -142,6 +152,47 @@ MOCK_FUND_DATA = [
     }
 ]
 
+# Column layout of the mock funds for vectorised analytics (one field per column)
+MOCK_DTYPE = np.dtype([
+    ("fund_name", "U64"),
+    ("target_equity_pct", "f8"),
+    ("report_date", "U10"),
+    ("equity_pct", "f8"),
+    ("fixed_income_pct", "f8"),
+    ("money_market_pct", "f8"),
+    ("other_pct", "f8"),
+    ("nav", "f8"),
+    ("net_assets_usd", "i8"),
+    ("expense_ratio", "f8"),
+    ("management_fee", "f8"),
+    ("one_year_return", "f8"),
+    ("portfolio_turnover", "f8"),
+    ("equity_futures_notional", "i8"),
+    ("bond_futures_notional", "i8"),
+    ("net_investment_income", "i8"),
+    ("total_distributions", "i8"),
+    ("net_asset_change", "i8"),
+    ("return_per_risk", "f8"),
+    ("drift", "f8"),
+])
+
+MOCK_FUND_ARR = np.array(
+    [tuple(fund[name] for name in MOCK_DTYPE.names) for fund in _MOCK_FUND_RECORDS],
+    dtype=MOCK_DTYPE,
+)
+
+def _arr_to_dicts(arr):
+    """Convert a MOCK_DTYPE array back into JSON-friendly fund dicts."""
+    names = arr.dtype.names
+    return [dict(zip(names, row)) for row in arr.tolist()]
+
+# Per-fund dicts for the SSE events, derived from the array so both views agree
+MOCK_FUND_DATA = _arr_to_dicts(MOCK_FUND_ARR)
+
+def summarize_mock_funds():
+    """Compute the performance metrics announced in the analysis phase."""
+    return summarize_funds(MOCK_FUND_ARR)
+
 def create_mock_events():
     """Create mock SSE events for testing."""
     events = []
@@ -182,6 +233,12 @@ def create_mock_events():
     # Analysis events
     events.append({"type": "status", "data": {"stage": "analysis", "progress": 90, "message": "Analyzing fund data..."}})
     events.append({"type": "text", "data": {"content": "📊 Computing performance metrics..."}})
+    metrics = summarize_mock_funds()
+    events.append({"type": "text", "data": {"content": (
+        f"📊 Avg equity {metrics['equity_pct_mean']:.1f}% (σ {metrics['equity_pct_std']:.1f}), "
+        f"max drift {metrics['drift_max']:.1f}, "
+        f"median return/risk {metrics['return_per_risk_median']:.1f}"
+    )}})
     
     # Completion
     events.append({"type": "status", "data": {"stage": "complete", "progress": 100, "message": "Extraction completed!"}})
@@ -193,20 +250,23 @@ def create_mock_events():
                 "total_funds": len(MOCK_FUND_DATA),
                 "pages_processed": 120,
                 "fund_sections": [f["fund_name"] for f in MOCK_FUND_DATA],
-                "session_id": "mock-session-123"
+                "session_id": "mock-session-123",
+                "metrics": metrics
             }
         }
     })
     
     return events
 
+# Mock events and their SSE encoding, built once at import
+_MOCK_EVENTS = create_mock_events()
+_MOCK_SSE_PAYLOAD = b"".join(b"data: " + _json_dumps_bytes(event) + b"\n\n" for event in _MOCK_EVENTS)
+
 def print_mock_events():
     """Print mock events in SSE format."""
-    events = create_mock_events()
-    
-    for event in events:
-        print(f"data: {json.dumps(event)}")
-        print()
+    sys.stdout.flush()  # keep anything already printed ahead of the payload
+    sys.stdout.buffer.write(_MOCK_SSE_PAYLOAD)
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     print("Mock Fund Extraction Events (SSE Format):")
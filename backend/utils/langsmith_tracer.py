@@ -1,11 +1,16 @@
 """LangSmith tracing utilities for agent monitoring."""
 
+import asyncio
+import atexit
+import contextvars
 import os
+import queue
+import threading
 import time
 import functools
-from typing import Any, Dict, Optional, Callable, AsyncGenerator
-from datetime import datetime
-import json
+import uuid
+from typing import Any, Dict, List, Optional, Callable, AsyncGenerator
+from datetime import datetime, timezone
 
 try:
     from langsmith import Client
@@ -14,6 +19,17 @@ except ImportError:
     LANGSMITH_AVAILABLE = False
     print("LangSmith not available - tracing disabled")
 
+# Most runs sent to LangSmith in one batch_ingest_runs request
+LOG_BATCH_SIZE = 100
+
+# Agent type of the traced method currently running, for log_event calls that don't pass one
+_current_agent_type: contextvars.ContextVar = contextvars.ContextVar("agent_type", default="unknown_agent")
+
+
+def _no_trace(obj):
+    """Decorator used when tracing is off: returns the function or class unchanged."""
+    return obj
+
 
 class LangSmithTracer:
     """LangSmith tracer for agent operations."""
@@ -22,10 +38,19 @@ class LangSmithTracer:
         self.enabled = False
         self.client = None
         
+        # Runs are sent by a background thread so traced calls never wait on LangSmith
+        self._log_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._log_worker: Optional[threading.Thread] = None
+        
         if LANGSMITH_AVAILABLE and self._is_configured():
             try:
                 self.client = Client()
                 self.enabled = True
+                self._log_worker = threading.Thread(
+                    target=self._drain_log_queue, name="langsmith-tracer", daemon=True
+                )
+                self._log_worker.start()
+                atexit.register(self.flush)
                 print("✅ LangSmith tracing enabled")
             except Exception as e:
                 print(f"⚠️ Failed to initialize LangSmith client: {e}")
@@ -50,123 +75,184 @@ class LangSmithTracer:
     
     def trace_agent_method(self, agent_type: str, method_name: str):
         """Decorator to trace agent methods."""
+        if not self.enabled:
+            return _no_trace
+        
         def decorator(func: Callable) -> Callable:
-            if not self.enabled:
-                return func
+            if asyncio.iscoroutinefunction(func):
+                return self._wrap_async(func, agent_type, method_name)
+            return self._wrap_sync(func, agent_type, method_name)
+        
+        return decorator
+    
+    def _wrap_async(self, func: Callable, agent_type: str, method_name: str) -> Callable:
+        """Tracing wrapper for a coroutine function."""
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            run_name = f"{agent_type}.{method_name}"
             
-            @functools.wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                run_name = f"{agent_type}.{method_name}"
+            # Extract agent instance and session info
+            agent_instance = args[0] if args else None
+            session_id = getattr(agent_instance, 'session_id', 'unknown')
+            
+            start_time = datetime.now(timezone.utc)  # wall clock, shared by inputs and the run
+            inputs = {
+                "agent_type": agent_type,
+                "method": method_name,
+                "session_id": session_id,
+                "timestamp": start_time,
+            }
+            
+            start_ns = time.perf_counter_ns()  # monotonic, for processing_time
+            token = _current_agent_type.set(agent_type)
+            
+            try:
+                result = await func(*args, **kwargs)
+                processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+                
+                # Log successful operation
+                self._log_operation(run_name, inputs, {
+                    "status": "completed",
+                    "processing_time_seconds": processing_time,
+                    "result_type": type(result).__name__
+                }, start_time)
                 
-                # Extract agent instance and session info
-                agent_instance = args[0] if args else None
-                session_id = getattr(agent_instance, 'session_id', 'unknown')
+                return result
                 
-                inputs = {
-                    "agent_type": agent_type,
-                    "method": method_name,
-                    "session_id": session_id,
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
+            except Exception as e:
+                processing_time = (time.perf_counter_ns() - start_ns) / 1e9
                 
-                start_time = time.time()
+                # Log error
+                self._log_operation(run_name, inputs, {
+                    "status": "error",
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                    "processing_time_seconds": processing_time
+                }, start_time)
                 
-                try:
-                    result = await func(*args, **kwargs)
-                    processing_time = time.time() - start_time
-                    
-                    # Log successful operation
-                    self._log_operation(run_name, inputs, {
-                        "status": "completed",
-                        "processing_time_seconds": processing_time,
-                        "result_type": type(result).__name__
-                    }, start_time)
-                    
-                    return result
-                    
-                except Exception as e:
-                    processing_time = time.time() - start_time
-                    
-                    # Log error
-                    self._log_operation(run_name, inputs, {
-                        "status": "error",
-                        "error_type": type(e).__name__,
-                        "error_message": str(e),
-                        "processing_time_seconds": processing_time
-                    }, start_time)
-                    
-                    raise
+                raise
             
-            @functools.wraps(func)
-            def sync_wrapper(*args, **kwargs):
-                if not self.enabled:
-                    return func(*args, **kwargs)
+            finally:
+                _current_agent_type.reset(token)
+        
+        return async_wrapper
+    
+    def _wrap_sync(self, func: Callable, agent_type: str, method_name: str) -> Callable:
+        """Tracing wrapper for a regular function."""
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            run_name = f"{agent_type}.{method_name}"
+            
+            agent_instance = args[0] if args else None
+            session_id = getattr(agent_instance, 'session_id', 'unknown')
+            
+            start_time = datetime.now(timezone.utc)  # wall clock, shared by inputs and the run
+            inputs = {
+                "agent_type": agent_type,
+                "method": method_name,
+                "session_id": session_id,
+                "timestamp": start_time,
+            }
+            
+            start_ns = time.perf_counter_ns()  # monotonic, for processing_time
+            token = _current_agent_type.set(agent_type)
+            
+            try:
+                result = func(*args, **kwargs)
+                processing_time = (time.perf_counter_ns() - start_ns) / 1e9
                 
-                run_name = f"{agent_type}.{method_name}"
+                # Log successful operation
+                self._log_operation(run_name, inputs, {
+                    "status": "completed",
+                    "processing_time_seconds": processing_time,
+                    "result_type": type(result).__name__
+                }, start_time)
                 
-                agent_instance = args[0] if args else None
-                session_id = getattr(agent_instance, 'session_id', 'unknown')
+                return result
                 
-                inputs = {
-                    "agent_type": agent_type,
-                    "method": method_name,
-                    "session_id": session_id,
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
+            except Exception as e:
+                processing_time = (time.perf_counter_ns() - start_ns) / 1e9
                 
-                start_time = time.time()
+                # Log error
+                self._log_operation(run_name, inputs, {
+                    "status": "error",
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                    "processing_time_seconds": processing_time
+                }, start_time)
                 
+                raise
+            
+            finally:
+                _current_agent_type.reset(token)
+        
+        return sync_wrapper
+    
+    def _enqueue_run(self, name: str, run_type: str, inputs: Dict, outputs: Dict,
+                     start_time: datetime, end_time: datetime):
+        """Queue a finished run for the background sender."""
+        self._log_queue.put({
+            "name": name,
+            "run_type": run_type,
+            "inputs": inputs,
+            "outputs": outputs,
+            "start_time": start_time,
+            "end_time": end_time,
+        })
+    
+    def _drain_log_queue(self):
+        """Background thread: send queued runs, up to LOG_BATCH_SIZE per request."""
+        while True:
+            batch = [self._log_queue.get()]
+            while len(batch) < LOG_BATCH_SIZE:
                 try:
-                    result = func(*args, **kwargs)
-                    processing_time = time.time() - start_time
-                    
-                    # Log successful operation
-                    self._log_operation(run_name, inputs, {
-                        "status": "completed",
-                        "processing_time_seconds": processing_time,
-                        "result_type": type(result).__name__
-                    }, start_time)
-                    
-                    return result
-                    
-                except Exception as e:
-                    processing_time = time.time() - start_time
-                    
-                    # Log error
-                    self._log_operation(run_name, inputs, {
-                        "status": "error",
-                        "error_type": type(e).__name__,
-                        "error_message": str(e),
-                        "processing_time_seconds": processing_time
-                    }, start_time)
-                    
-                    raise
+                    batch.append(self._log_queue.get_nowait())
+                except queue.Empty:
+                    break
             
-            # Return appropriate wrapper based on function type
-            if hasattr(func, '__code__') and func.__code__.co_flags & 0x80:  # CO_COROUTINE
-                return async_wrapper
-            else:
-                return sync_wrapper
+            try:
+                self._send_runs(batch)
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
+    
+    def _send_runs(self, batch: List[Dict[str, Any]]):
+        """Send a batch of queued runs to LangSmith as root runs."""
+        project_name = os.getenv('LANGCHAIN_PROJECT', 'fund-onboarding-agents')
+        runs = []
+        for run in batch:
+            run_id = uuid.uuid4()
+            runs.append({
+                **run,
+                "id": run_id,
+                "trace_id": run_id,
+                "dotted_order": f"{run['start_time']:%Y%m%dT%H%M%S%fZ}{run_id}",
+                "session_name": project_name,
+            })
         
-        return decorator
+        try:
+            self.client.batch_ingest_runs(create=runs)
+        except Exception as e:
+            print(f"Failed to log {len(runs)} runs to LangSmith: {e}")
     
-    def _log_operation(self, run_name: str, inputs: Dict, outputs: Dict, start_time: float):
+    def flush(self):
+        """Block until every queued run has been sent."""
+        if self._log_worker is not None and self._log_worker.is_alive():
+            self._log_queue.join()
+    
+    def _log_operation(self, run_name: str, inputs: Dict, outputs: Dict, start_time: datetime):
         """Log an operation to LangSmith."""
         if not self.enabled:
             return
         
-        try:
-            self.client.create_run(
-                name=run_name,
-                run_type="chain",
-                inputs=inputs,
-                outputs=outputs,
-                start_time=datetime.utcfromtimestamp(start_time),
-                end_time=datetime.utcnow(),
-                project_name=os.getenv('LANGCHAIN_PROJECT', 'fund-onboarding-agents')
-            )
-        except Exception as e:
-            print(f"Failed to log to LangSmith: {e}")
+        self._enqueue_run(
+            run_name,
+            "chain",
+            inputs,
+            outputs,
+            start_time=start_time,
+            end_time=datetime.now(timezone.utc)
+        )
     
     def log_agent_event(self, agent_type: str, event_type: str, data: Dict[str, Any]):
         """Log an agent event to LangSmith."""
@@ -175,22 +261,22 @@ class LangSmithTracer:
         
         try:
             event_name = f"{agent_type}.{event_type}"
+            now = datetime.now(timezone.utc)
             
             inputs = {
                 "agent_type": agent_type,
                 "event_type": event_type,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now,
                 **data
             }
             
-            self.client.create_run(
-                name=event_name,
-                run_type="tool",
-                inputs=inputs,
-                outputs={"status": "logged"},
-                start_time=datetime.utcnow(),
-                end_time=datetime.utcnow(),
-                project_name=os.getenv('LANGCHAIN_PROJECT', 'fund-onboarding-agents')
+            self._enqueue_run(
+                event_name,
+                "tool",
+                inputs,
+                {"status": "logged"},
+                start_time=now,
+                end_time=now
             )
                 
         except Exception as e:
@@ -203,60 +289,42 @@ tracer = LangSmithTracer()
 
 def trace_agent(agent_type: str):
     """Class decorator to trace all methods of an agent."""
-    def class_decorator(cls):
-        # Temporarily disable method-level tracing to debug issues
-        # Only keep event logging
-        return cls
-    
-    return class_decorator
+    # Temporarily disable method-level tracing to debug issues
+    # Only keep event logging
+    return _no_trace
 
 
 def trace_method(method_name: str = None):
     """Method decorator for individual method tracing."""
+    if not tracer.enabled:
+        return _no_trace
+    
     def decorator(func: Callable) -> Callable:
-        if not tracer.enabled:
-            return func
-        
         name = method_name or func.__name__
         
-        @functools.wraps(func)
-        async def async_wrapper(self, *args, **kwargs):
-            agent_type = getattr(self, 'agent_type', type(self).__name__)
-            return await tracer.trace_agent_method(agent_type, name)(func)(self, *args, **kwargs)
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                agent_type = getattr(self, 'agent_type', type(self).__name__)
+                return await tracer.trace_agent_method(agent_type, name)(func)(self, *args, **kwargs)
+            
+            return async_wrapper
         
         @functools.wraps(func)
         def sync_wrapper(self, *args, **kwargs):
             agent_type = getattr(self, 'agent_type', type(self).__name__)
             return tracer.trace_agent_method(agent_type, name)(func)(self, *args, **kwargs)
         
-        # Return appropriate wrapper
-        if hasattr(func, '__code__') and func.__code__.co_flags & 0x80:  # CO_COROUTINE
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
     
     return decorator
 
 
-def log_event(event_type: str, **data):
-    """Utility function to log events from within agent methods."""
-    def get_agent_context():
-        import inspect
-        frame = inspect.currentframe()
-        try:
-            # Walk up the stack to find agent instance
-            for _ in range(10):  # Limit depth
-                frame = frame.f_back
-                if not frame:
-                    break
-                
-                local_self = frame.f_locals.get('self')
-                if local_self and hasattr(local_self, 'agent_type'):
-                    return str(local_self.agent_type)
-                    
-            return "unknown_agent"
-        finally:
-            del frame
+def log_event(event_type: str, agent_type: Optional[str] = None, **data):
+    """Utility function to log events from within agent methods.
     
-    agent_type = get_agent_context()
+    agent_type defaults to that of the traced agent method currently running.
+    """
+    if agent_type is None:
+        agent_type = _current_agent_type.get()
     tracer.log_agent_event(agent_type, event_type, data)
\ No newline at end of file
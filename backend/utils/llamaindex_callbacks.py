@@ -1,8 +1,12 @@
 """LlamaIndex callbacks for LangSmith integration."""
 
+import atexit
 import os
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import queue
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
 
 # Check for LangSmith availability
 try:
@@ -21,42 +25,96 @@ except ImportError:
     CBEventType = None
     EventPayload = None
 
+# Most run creates/updates sent to LangSmith in one batch_ingest_runs request
+RUN_BATCH_SIZE = 100
+
+
+def _truncate_str(value: str) -> str:
+    """Limit string length for readability."""
+    return value[:1000] + "..." if len(value) > 1000 else value
+
+
+def _truncate_list(value: list) -> list:
+    """Limit list length for readability."""
+    return value[:10] + ["..."] if len(value) > 10 else value
+
+
+def _keep(value: Any) -> Any:
+    return value
+
+
+# Serializable payload value types and how each is trimmed, looked up by exact type
+_PAYLOAD_HANDLERS = {
+    str: _truncate_str,
+    list: _truncate_list,
+    dict: _keep,
+    int: _keep,
+    float: _keep,
+    bool: _keep,
+}
+
 # Only define the callback handler if both are available
 if LANGSMITH_AVAILABLE and LLAMAINDEX_AVAILABLE:
+    # High-volume per-node events not worth tracing; LlamaIndex skips the handler for these
+    IGNORED_EVENT_TYPES = [CBEventType.CHUNKING, CBEventType.NODE_PARSING]
+    
+    # LlamaIndex event type -> LangSmith run type; anything else is a "tool" run
+    _RUN_TYPE_MAP = {
+        CBEventType.CHUNKING: "tool",
+        CBEventType.NODE_PARSING: "tool",
+        CBEventType.EMBEDDING: "llm",
+        CBEventType.LLM: "llm",
+        CBEventType.QUERY: "chain",
+        CBEventType.RETRIEVE: "retriever",
+        CBEventType.SYNTHESIZE: "chain",
+        CBEventType.TREE: "chain",
+        CBEventType.SUB_QUESTION: "chain",
+    }
+    
+    # Base run name of each event type, e.g. CBEventType.SUB_QUESTION -> "sub_question"
+    _EVENT_NAMES = {event_type: event_type.name.lower() for event_type in CBEventType}
+    
     class LangSmithCallbackHandler(BaseCallbackHandler):
         """LangSmith callback handler for LlamaIndex operations."""
         
         def __init__(self):
             self.enabled = False
             self.client = None
+            self._project = os.getenv('LANGCHAIN_PROJECT', 'fund-onboarding-agents')
+            
+            # Runs still open, by event id, so children can be placed under their parent
+            self._open_runs: Dict[str, Dict[str, Any]] = {}
+            
+            # Run creates/updates are sent by a background thread so events never wait on LangSmith
+            self._run_queue: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue()
+            self._run_worker: Optional[threading.Thread] = None
             
             if self._is_configured():
                 try:
                     self.client = Client()
                     self.enabled = True
+                    self._run_worker = threading.Thread(
+                        target=self._drain_run_queue, name="langsmith-callbacks", daemon=True
+                    )
+                    self._run_worker.start()
+                    atexit.register(self.flush)
                     print("✅ LangSmith LlamaIndex callbacks enabled")
                 except Exception as e:
                     print(f"⚠️ Failed to initialize LangSmith client for callbacks: {e}")
                     self.enabled = False
             
             super().__init__(
-                event_starts_to_ignore=[],
-                event_ends_to_ignore=[]
+                event_starts_to_ignore=IGNORED_EVENT_TYPES,
+                event_ends_to_ignore=IGNORED_EVENT_TYPES
             )
         
         def _is_configured(self) -> bool:
             """Check if LangSmith is properly configured."""
-            required_vars = [
-                'LANGCHAIN_TRACING_V2',
-                'LANGCHAIN_API_KEY',
-                'LANGCHAIN_PROJECT'
-            ]
+            tracing = os.getenv('LANGCHAIN_TRACING_V2', '')
+            if not (os.getenv('LANGCHAIN_API_KEY') and os.getenv('LANGCHAIN_PROJECT')):
+                return False
             
-            for var in required_vars:
-                if not os.getenv(var):
-                    return False
-            
-            return os.getenv('LANGCHAIN_TRACING_V2', '').lower() == 'true'
+            return tracing.lower() == 'true'
         
         def on_event_start(
             self,
@@ -75,9 +133,11 @@ if LANGSMITH_AVAILABLE and LLAMAINDEX_AVAILABLE:
                 run_type = self._map_event_to_run_type(event_type)
                 run_name = self._get_run_name(event_type, payload)
                 
+                # One clock read per event; the LangSmith client serializes datetimes when sending
+                start_time = datetime.now(timezone.utc)
                 inputs = {
                     "event_type": str(event_type),
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": start_time,
                 }
                 
                 # Add payload data
@@ -86,17 +146,31 @@ if LANGSMITH_AVAILABLE and LLAMAINDEX_AVAILABLE:
                     filtered_payload = self._filter_payload(payload)
                     inputs.update(filtered_payload)
                 
-                # Create run
-                run = self.client.create_run(
-                    name=run_name,
-                    run_type=run_type,
-                    inputs=inputs,
-                    project_name=os.getenv('LANGCHAIN_PROJECT', 'fund-onboarding-agents'),
-                    parent_run_id=parent_id if parent_id else None,
-                    run_id=event_id if event_id else None
-                )
+                run_id = uuid.UUID(event_id) if event_id else uuid.uuid4()
+                dotted_order = f"{start_time:%Y%m%dT%H%M%S%fZ}{run_id}"
+                
+                run = {
+                    "id": run_id,
+                    "name": run_name,
+                    "run_type": run_type,
+                    "inputs": inputs,
+                    "start_time": start_time,
+                    "session_name": self._project,
+                }
+                
+                parent = self._open_runs.get(parent_id) if parent_id else None
+                if parent is not None:
+                    run["parent_run_id"] = parent["id"]
+                    run["trace_id"] = parent["trace_id"]
+                    run["dotted_order"] = f"{parent['dotted_order']}.{dotted_order}"
+                else:
+                    run["trace_id"] = run_id
+                    run["dotted_order"] = dotted_order
                 
-                return str(run.id)
+                self._open_runs[str(run_id)] = run
+                self._run_queue.put(("create", run))
+                
+                return str(run_id)
                 
             except Exception as e:
                 print(f"Error in LangSmith callback start: {e}")
@@ -120,16 +194,49 @@ if LANGSMITH_AVAILABLE and LLAMAINDEX_AVAILABLE:
                     filtered_payload = self._filter_payload(payload)
                     outputs.update(filtered_payload)
                 
-                # Update the run
-                self.client.update_run(
-                    run_id=event_id,
-                    outputs=outputs,
-                    end_time=datetime.utcnow()
-                )
+                run = self._open_runs.pop(event_id, None)
+                if run is None:
+                    return
+                
+                update = {
+                    "id": run["id"],
+                    "trace_id": run["trace_id"],
+                    "dotted_order": run["dotted_order"],
+                    "outputs": outputs,
+                    "end_time": datetime.now(timezone.utc),
+                }
+                if "parent_run_id" in run:
+                    update["parent_run_id"] = run["parent_run_id"]
+                self._run_queue.put(("update", update))
                 
             except Exception as e:
                 print(f"Error in LangSmith callback end: {e}")
         
+        def _drain_run_queue(self):
+            """Background thread: send queued runs, up to RUN_BATCH_SIZE per request."""
+            while True:
+                batch = [self._run_queue.get()]
+                while len(batch) < RUN_BATCH_SIZE:
+                    try:
+                        batch.append(self._run_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                try:
+                    create = [run for op, run in batch if op == "create"]
+                    update = [run for op, run in batch if op == "update"]
+                    self.client.batch_ingest_runs(create=create, update=update)
+                except Exception as e:
+                    print(f"Failed to log {len(batch)} LlamaIndex runs to LangSmith: {e}")
+                finally:
+                    for _ in batch:
+                        self._run_queue.task_done()
+        
+        def flush(self):
+            """Block until every queued run has been sent."""
+            if self._run_worker is not None and self._run_worker.is_alive():
+                self._run_queue.join()
+        
         def start_trace(self, trace_id: Optional[str] = None) -> None:
             """Start a new trace."""
             pass
@@ -144,22 +251,11 @@ if LANGSMITH_AVAILABLE and LLAMAINDEX_AVAILABLE:
         
         def _map_event_to_run_type(self, event_type: CBEventType) -> str:
             """Map LlamaIndex event types to LangSmith run types."""
-            mapping = {
-                CBEventType.CHUNKING: "tool",
-                CBEventType.NODE_PARSING: "tool",
-                CBEventType.EMBEDDING: "llm",
-                CBEventType.LLM: "llm",
-                CBEventType.QUERY: "chain",
-                CBEventType.RETRIEVE: "retriever",
-                CBEventType.SYNTHESIZE: "chain",
-                CBEventType.TREE: "chain",
-                CBEventType.SUB_QUESTION: "chain",
-            }
-            return mapping.get(event_type, "tool")
+            return _RUN_TYPE_MAP.get(event_type, "tool")
         
         def _get_run_name(self, event_type: CBEventType, payload: Optional[Dict[str, Any]]) -> str:
             """Generate a descriptive run name."""
-            base_name = str(event_type).split('.')[-1].lower()
+            base_name = _EVENT_NAMES.get(event_type) or str(event_type).split('.')[-1].lower()
             
             if payload:
                 # Try to add context from payload
@@ -174,24 +270,21 @@ if LANGSMITH_AVAILABLE and LLAMAINDEX_AVAILABLE:
         
         def _filter_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
             """Filter payload to remove non-serializable items."""
+            if not payload or not self.enabled:
+                return {}
+            
             filtered = {}
             
             for key, value in payload.items():
                 try:
-                    # Only include serializable types
-                    if isinstance(value, (str, int, float, bool, list, dict)):
-                        # Limit string length for readability
-                        if isinstance(value, str) and len(value) > 1000:
-                            filtered[key] = value[:1000] + "..."
-                        elif isinstance(value, list) and len(value) > 10:
-                            filtered[key] = value[:10] + ["..."]
-                        else:
-                            filtered[key] = value
-                    elif hasattr(value, '__dict__'):
-                        # Try to serialize object dict
-                        filtered[key] = str(type(value).__name__)
-                    else:
-                        filtered[key] = str(type(value).__name__)
+                    # Only include serializable types; other objects are recorded by type name
+                    handler = _PAYLOAD_HANDLERS.get(type(value))
+                    if handler is None:
+                        # Subclasses of the serializable types (e.g. str enums) are rare
+                        handler = next(
+                            (h for t, h in _PAYLOAD_HANDLERS.items() if isinstance(value, t)), None
+                        )
+                    filtered[key] = handler(value) if handler else type(value).__name__
                         
                 except Exception:
                     # Skip problematic fields
@@ -1,37 +1,79 @@
 """S3 storage utilities for file uploads."""
 
+import asyncio
+import io
 import os
+import time
 import boto3
 import uuid
 import logging
-from typing import Optional
-from pathlib import Path
+from contextlib import nullcontext
+from typing import BinaryIO, Dict, Optional, Union
+from urllib.parse import urlparse
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+# Seconds a successful head_bucket probe stays valid for new S3Storage instances
+VALIDATION_TTL = 3600
+
+# Bucket name -> time.monotonic() of its last successful probe in this process
+_validated_buckets: Dict[str, float] = {}
+
+# Content type by lowercase file extension, for uploads that don't supply one
+CONTENT_TYPES = {
+    '.pdf': 'application/pdf',
+    '.csv': 'text/csv',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.xls': 'application/vnd.ms-excel',
+}
+
 class S3Storage:
     """Handle S3 file operations for uploaded documents."""
     
     def __init__(self):
         self.bucket_name = "fundonboarding"
         self.region = os.getenv("AWS_REGION", "us-east-1")
+        self._host_prefix = f"{self.bucket_name}.s3.{self.region}.amazonaws.com/"
         
         # Initialize S3 client with credentials from environment
         self.s3_client = boto3.client(
             's3',
             aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
             aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            region_name=self.region
+            region_name=self.region,
+            config=Config(
+                retries={'max_attempts': 3, 'mode': 'adaptive'},
+                tcp_keepalive=True,
+                max_pool_connections=50
+            )
+        )
+        
+        # Files above 8 MB go up/down as concurrent multipart transfers
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * MB,
+            multipart_chunksize=8 * MB,
+            max_concurrency=10,
+            use_threads=True
         )
         
         # Validate credentials on initialization
         self._validate_connection()
     
     def _validate_connection(self):
-        """Validate S3 connection and bucket access."""
+        """Validate S3 connection and bucket access, at most once per VALIDATION_TTL."""
+        validated_at = _validated_buckets.get(self.bucket_name)
+        if validated_at is not None and time.monotonic() - validated_at < VALIDATION_TTL:
+            return
+        
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
+            _validated_buckets[self.bucket_name] = time.monotonic()
             logger.info(f"✅ S3 connection validated for bucket: {self.bucket_name}")
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -43,12 +85,40 @@ class S3Storage:
                 logger.error(f"❌ S3 connection error: {error_code}")
             raise e
     
-    async def upload_file(self, file_content: bytes, filename: str, content_type: str = None) -> str:
+    def _key_from_url(self, s3_url: str) -> str:
+        """Return the object key of an S3 URL for this bucket."""
+        # URLs built by upload_file; the key may itself contain '?' or '#'
+        _, found, key = s3_url.partition(self._host_prefix)
+        if found:
+            return key
+        
+        # Path-style (https://s3.<region>.amazonaws.com/<bucket>/<key>) or s3://<bucket>/<key>
+        path = urlparse(s3_url).path.lstrip('/')
+        bucket_prefix = f"{self.bucket_name}/"
+        return path[len(bucket_prefix):] if path.startswith(bucket_prefix) else path
+    
+    def _upload_source(self, file_content: Union[bytes, str, os.PathLike, BinaryIO], s3_key: str, extra_args: dict):
+        """Blocking upload of bytes, a local file path or a binary file object."""
+        if isinstance(file_content, (bytes, bytearray, memoryview)):
+            source = nullcontext(io.BytesIO(file_content))
+        elif isinstance(file_content, (str, os.PathLike)):
+            # Stream from disk; only multipart chunks are held in memory
+            source = open(file_content, "rb")
+        else:
+            source = nullcontext(file_content)
+        
+        with source as fileobj:
+            self.s3_client.upload_fileobj(
+                fileobj, self.bucket_name, s3_key, ExtraArgs=extra_args, Config=self.transfer_config
+            )
+    
+    async def upload_file(self, file_content: Union[bytes, str, os.PathLike, BinaryIO], filename: str,
+                          content_type: str = None) -> str:
         """
         Upload file to S3 and return the S3 URL.
         
         Args:
-            file_content: File content as bytes
+            file_content: File content as bytes, a local file path, or a binary file object
             filename: Original filename
             content_type: MIME type of the file
             
@@ -57,37 +127,33 @@ class S3Storage:
         """
         try:
             # Generate unique filename
-            file_extension = Path(filename).suffix
             unique_filename = f"{uuid.uuid4()}_{filename}"
             s3_key = f"uploads/{unique_filename}"
             
             # Determine content type if not provided
             if not content_type:
-                if file_extension.lower() == '.pdf':
-                    content_type = 'application/pdf'
-                elif file_extension.lower() in ['.csv']:
-                    content_type = 'text/csv'
-                elif file_extension.lower() in ['.xlsx', '.xls']:
-                    content_type = 'application/vnd.ms-excel'
-                else:
-                    content_type = 'application/octet-stream'
-            
-            # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=file_content,
-                ContentType=content_type,
-                ServerSideEncryption='AES256'  # Encrypt at rest
+                file_extension = os.path.splitext(filename)[1].lower()
+                content_type = CONTENT_TYPES.get(file_extension, 'application/octet-stream')
+            
+            # Upload to S3 off the event loop
+            await asyncio.to_thread(
+                self._upload_source,
+                file_content,
+                s3_key,
+                {
+                    "ContentType": content_type,
+                    "ServerSideEncryption": "AES256"  # Encrypt at rest
+                }
             )
             
             # Generate S3 URL
-            s3_url = f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{s3_key}"
+            s3_url = f"https://{self._host_prefix}{s3_key}"
             
             logger.info(f"✅ File uploaded to S3: {filename} -> {s3_url}")
             return s3_url
             
-        except ClientError as e:
+        # Managed transfers wrap ClientError in S3UploadFailedError
+        except (ClientError, S3UploadFailedError) as e:
             logger.error(f"❌ Failed to upload {filename} to S3: {str(e)}")
             raise e
     
@@ -104,13 +170,19 @@ class S3Storage:
         """
         try:
             # Extract S3 key from URL
-            s3_key = s3_url.split(f"{self.bucket_name}.s3.{self.region}.amazonaws.com/")[1]
+            s3_key = self._key_from_url(s3_url)
             
             # Create local directory if it doesn't exist
             os.makedirs(os.path.dirname(local_path), exist_ok=True)
             
-            # Download from S3
-            self.s3_client.download_file(self.bucket_name, s3_key, local_path)
+            # Download from S3 off the event loop
+            await asyncio.to_thread(
+                self.s3_client.download_file,
+                self.bucket_name,
+                s3_key,
+                local_path,
+                Config=self.transfer_config
+            )
             
             logger.info(f"✅ File downloaded from S3: {s3_url} -> {local_path}")
             return local_path
@@ -131,10 +203,10 @@ class S3Storage:
         """
         try:
             # Extract S3 key from URL
-            s3_key = s3_url.split(f"{self.bucket_name}.s3.{self.region}.amazonaws.com/")[1]
+            s3_key = self._key_from_url(s3_url)
             
-            # Delete from S3
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
+            # Delete from S3 off the event loop
+            await asyncio.to_thread(self.s3_client.delete_object, Bucket=self.bucket_name, Key=s3_key)
             
             logger.info(f"✅ File deleted from S3: {s3_url}")
             return True
@@ -155,7 +227,7 @@ class S3Storage:
         """
         try:
             # Extract S3 key from URL
-            s3_key = s3_url.split(f"{self.bucket_name}.s3.{self.region}.amazonaws.com/")[1]
+            s3_key = self._key_from_url(s3_url)
             
             # Get object metadata
             response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
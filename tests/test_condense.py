@@ -0,0 +1,53 @@
+"""Test section condensing for the multi-fund Gemini extractor."""
+
+import sys
+from pathlib import Path
+
+# Add parent directories to path
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+from gemini_multi_fund_extractor import _condense
+
+
+def test_content_within_budget_unchanged():
+    """Short content is passed through as-is."""
+    content = "Net Assets: $1.2B\n\nExpense ratio: 0.03%"
+    assert _condense(content) == content
+    print("✓ Content within budget returned unchanged")
+
+
+def test_single_oversized_paragraph():
+    """A table with no blank lines is truncated, not dropped."""
+    table = "| Holding | NAV | Net Assets |\n" * 400
+    condensed = _condense(table, budget=6000)
+    assert condensed, "oversized paragraph was dropped"
+    assert len(condensed) <= 6000
+    assert table.startswith(condensed)
+    print("✓ Single oversized paragraph truncated to budget")
+
+
+def test_relevant_paragraphs_kept_in_order():
+    """Keyword-rich paragraphs win and keep their original order."""
+    intro = "Lorem ipsum " * 300
+    objective = "Objective: track the benchmark. Benchmark: CRSP US Total Market."
+    nav = "NAV per share 250.12; Net Assets $1.8T; Expense ratio 0.03%."
+    content = "\n\n".join([objective, intro, nav])
+    condensed = _condense(content, budget=1000)
+    assert condensed.startswith(objective)
+    assert nav in condensed
+    assert len(condensed) <= 1000
+    print("✓ Relevant paragraphs kept in order, remainder truncated")
+
+
+def main():
+    """Run all condense tests."""
+    print("Testing _condense...")
+    test_content_within_budget_unchanged()
+    test_single_oversized_paragraph()
+    test_relevant_paragraphs_kept_in_order()
+    print("✓ All condense tests passed")
+
+
+if __name__ == "__main__":
+    main()
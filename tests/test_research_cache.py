@@ -0,0 +1,182 @@
+"""Test script for the research data cache (write queue, persistence, eviction)."""
+
+import asyncio
+import sqlite3
+import sys
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+# Add the services directory to the path so we can import the cache module
+sys.path.append(str(Path(__file__).parent.parent / "backend" / "services"))
+
+from research_cache import ResearchDataCache, ZSTD_AVAILABLE
+
+
+class FundRecord(dict):
+    """dict subclass used to check that cached values keep their type."""
+
+
+async def test_pending_write_hit(cache_dir: str):
+    """A value is readable right after set(), before the writer stores it."""
+    print("Testing get() from pending writes...")
+    cache = ResearchDataCache(cache_dir)
+
+    await cache.set({"ticker": "VTI"}, key="pending")
+    cache.memory_cache.clear()  # force the pending-write path
+
+    assert cache.get_stats()["pending_writes"] == 1
+    assert await cache.get("pending") == {"ticker": "VTI"}
+
+    cache.close()
+    print("✓ Pending write served before flush")
+
+
+async def test_persistence(cache_dir: str):
+    """Entries survive flush() and close() followed by reopening the database."""
+    print("Testing persistence across reopen...")
+    cache = ResearchDataCache(cache_dir)
+
+    await cache.set("flushed", key="flushed")
+    await cache.flush()
+    stats = cache.get_stats()
+    assert stats["pending_writes"] == 0
+    assert stats["disk_entries"] == 1
+
+    await cache.set("closed", key="closed")
+    cache.close()  # writes the still-pending entry
+
+    reopened = ResearchDataCache(cache_dir)
+    assert await reopened.get("flushed") == "flushed"
+    assert await reopened.get("closed") == "closed"
+    assert reopened.get_stats()["disk_entries"] == 2
+    reopened.close()
+    print("✓ Entries persisted after flush and close")
+
+
+async def test_delete_by_tags(cache_dir: str):
+    """delete_by_tags removes tagged entries on disk, pending and in memory."""
+    print("Testing delete_by_tags...")
+    cache = ResearchDataCache(cache_dir)
+
+    await cache.set("a", key="a", tags=["fund:VTI"])
+    await cache.set("b", key="b", tags=["fund:VTV"])
+    await cache.flush()
+    await cache.set("c", key="c", tags=["fund:VTI", "fund:VTV"])  # still pending
+
+    await cache.delete_by_tags(["fund:VTI"])
+
+    assert await cache.get("a") is None
+    assert await cache.get("c") is None
+    assert await cache.get("b") == "b"
+    await cache.flush()
+    assert cache.get_stats()["disk_entries"] == 1
+    cache.close()
+    print("✓ Tagged entries deleted")
+
+
+async def test_bloom_after_clear_all(cache_dir: str):
+    """clear_all resets the Bloom filter; reopening rebuilds it from disk."""
+    print("Testing Bloom filter after clear_all...")
+    cache = ResearchDataCache(cache_dir)
+
+    await cache.set("old", key="old")
+    await cache.flush()
+    assert "old" in cache._bloom
+
+    await cache.clear_all()
+    assert "old" not in cache._bloom
+    assert await cache.get("old") is None
+    assert cache.get_stats()["disk_entries"] == 0
+
+    await cache.set("new", key="new")
+    assert "new" in cache._bloom
+    cache.close()
+
+    reopened = ResearchDataCache(cache_dir)
+    assert "new" in reopened._bloom
+    assert "old" not in reopened._bloom
+    assert await reopened.get("new") == "new"
+    reopened.close()
+    print("✓ Bloom filter reset by clear_all and rebuilt on reopen")
+
+
+async def test_sieve_eviction_order(cache_dir: str):
+    """Visited entries survive one pass of the SIEVE hand; unvisited ones go first."""
+    print("Testing SIEVE eviction order...")
+    probe = ResearchDataCache(cache_dir)
+    item_size = len(probe._serialize_value("x" * 100))
+    probe.close()
+
+    # Room for exactly ten equally sized entries
+    cache = ResearchDataCache(cache_dir, max_memory_size=10 * item_size)
+    for i in range(10):
+        await cache.set("x" * 100, key=f"k{i}")
+    assert len(cache.memory_cache) == 10
+
+    # Mark k0 and k2 as visited
+    await cache.get("k0")
+    await cache.get("k2")
+
+    for i in range(10, 13):
+        await cache.set("x" * 100, key=f"k{i}")
+
+    expected = {"k0", "k2"} | {f"k{i}" for i in range(5, 13)}
+    assert set(cache.memory_cache) == expected, sorted(cache.memory_cache)
+    assert cache.get_stats()["evictions"] == 3
+    cache.close()
+    print("✓ SIEVE evicted k1, k3, k4 and kept visited k0, k2")
+
+
+async def test_value_round_trips(cache_dir: str):
+    """Tuples, dict subclasses and large (compressed) values come back unchanged."""
+    print("Testing value round-trips through disk...")
+    cache = ResearchDataCache(cache_dir)
+
+    large = {"holdings": ["AAPL", "MSFT", "NVDA"] * 200}
+    values = {
+        "tuple": (1, "two", 3.0),
+        "subclass": FundRecord(ticker="VTI", nav=250.12),
+        "ordered": OrderedDict([("b", 1), ("a", 2)]),
+        "large": large,
+    }
+    for key, value in values.items():
+        await cache.set(value, key=key)
+    cache.close()
+
+    if ZSTD_AVAILABLE:
+        with sqlite3.connect(Path(cache_dir) / "research_cache.db") as conn:
+            blob = conn.execute("SELECT value FROM cache_entries WHERE key = 'large'").fetchone()[0]
+        assert blob[:1] == b"Z", "values over 512 bytes should be stored zstd-compressed"
+
+    reopened = ResearchDataCache(cache_dir)
+    for key, value in values.items():
+        loaded = await reopened.get(key)
+        assert loaded == value, key
+        assert type(loaded) is type(value), key
+    reopened.close()
+    print("✓ Values round-trip with their types intact")
+
+
+async def main():
+    """Run all research cache tests, each against a fresh temporary cache_dir."""
+    print("🧪 Research Cache Tests")
+    print("=" * 50)
+
+    tests = [
+        test_pending_write_hit,
+        test_persistence,
+        test_delete_by_tags,
+        test_bloom_after_clear_all,
+        test_sieve_eviction_order,
+        test_value_round_trips,
+    ]
+    for test in tests:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            await test(cache_dir)
+
+    print("\n🎉 All research cache tests passed!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())